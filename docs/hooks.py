@@ -2,19 +2,47 @@
 
 import json
 import os
+import re
 from pathlib import Path
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_MANIFEST_PATH = (Path(__file__).parent.parent / "dxt" / "manifest.json").resolve()
+
+# Parsed manifests keyed by (path, mtime_ns, size) so serve-mode rebuilds
+# skip re-reading an unchanged manifest
+_MANIFEST_CACHE: dict[tuple, dict] = {}
+
+# Matches both version placeholder spellings in a single pass
+_VERSION_RE = re.compile(r"\{\{\s*version\s*\}\}|\{\{VERSION\}\}")
+
+
+def _load_manifest(manifest_path):
+    """Load the DXT manifest, reusing the cached parse if the file is unchanged."""
+    st = os.stat(manifest_path)
+    key = (str(manifest_path), st.st_mtime_ns, st.st_size)
+    manifest = _MANIFEST_CACHE.get(key)
+    if manifest is None:
+        with open(manifest_path, 'rb') as f:
+            manifest = _loads(f.read())
+        _MANIFEST_CACHE.clear()
+        _MANIFEST_CACHE[key] = manifest
+    return manifest
+
 
 def on_pre_build(config, **kwargs):
     """Pre-build hook to generate dynamic content."""
 
     # Get version from manifest
     try:
-        manifest_path = Path(__file__).parent.parent / "dxt" / "manifest.json"
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        manifest = _load_manifest(_MANIFEST_PATH)
         version = manifest.get('version', '0.1.0')
-    except:
+    except (OSError, json.JSONDecodeError):
         version = '0.1.0'
 
     # Update version in config
@@ -26,10 +54,10 @@ def on_pre_build(config, **kwargs):
 def on_page_markdown(markdown, page, config, **kwargs):
     """Process page markdown for dynamic content."""
 
+    # Most pages carry no placeholders at all
+    if "{{" not in markdown:
+        return markdown
+
     # Replace version placeholders
     version = config.extra.get('version', '0.1.0')
-    markdown = markdown.replace('{{ version }}', version)
-    markdown = markdown.replace('{{VERSION}}', version)
-
-    return markdown
-
+    return _VERSION_RE.sub(version, markdown)
@@ -11,12 +11,71 @@ This script handles various deployment scenarios including:
 """
 
 import argparse
+import asyncio
+import functools
 import json
 import os
+import shutil
 import subprocess
 import sys
+import types
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+# Independent tool probes, run concurrently by check_prerequisites
+PREREQUISITE_PROBES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("HandBrake CLI", ("HandBrakeCLI", "--version")),
+    ("Docker", ("docker", "--version")),
+    ("Git", ("git", "--version")),
+    ("pip", (sys.executable, "-m", "pip", "--version")),
+)
+
+
+@dataclass(frozen=True)
+class DXTManifest:
+    """DXT manifest fields used by deployment; unknown fields are ignored."""
+
+    version: str = "0.1.0"
+    name: str = "handbrake-mcp"
+
+
+# Probe results keyed by argv, so repeated checks in one run never re-spawn
+_PROBE_RESULTS: Dict[Tuple[str, ...], Optional[str]] = {}
+
+
+async def probe_command(argv: Tuple[str, ...]) -> Optional[str]:
+    """Run a quick version probe and return its first output line, or None if unavailable."""
+    if argv in _PROBE_RESULTS:
+        return _PROBE_RESULTS[argv]
+
+    version = None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    except OSError:
+        proc = None
+
+    if proc is not None:
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+        else:
+            if proc.returncode == 0:
+                output = stdout.decode(errors="replace").strip()
+                version = output.splitlines()[0] if output else ""
+
+    _PROBE_RESULTS[argv] = version
+    return version
+
+
+async def probe_all(probes: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> List[Optional[str]]:
+    """Run all probes concurrently on one event loop, returning results in order."""
+    return await asyncio.gather(*(probe_command(argv) for _, argv in probes))
+
 
 class DeploymentManager:
     """Manages deployment of HandBrake MCP Server."""
@@ -24,16 +83,37 @@ class DeploymentManager:
     def __init__(self, environment: str = "development"):
         self.environment = environment
         self.project_root = Path(__file__).parent.parent
-        self.dxt_manifest = self._load_dxt_manifest()
+        dxt_dir = self.project_root / "dxt"
+        self.paths = types.SimpleNamespace(
+            dxt=dxt_dir,
+            manifest=dxt_dir / "manifest.json",
+            venv=dxt_dir / "venv",
+            setup_script=dxt_dir / "setup-venv.py",
+            requirements=dxt_dir / "requirements-dxt.txt",
+            dist=self.project_root / "dist",
+        )
+
+    def _dxt_entries(self) -> Set[str]:
+        """Names in the dxt/ directory, listed with a single scandir call."""
+        try:
+            with os.scandir(self.paths.dxt) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
 
-    def _load_dxt_manifest(self) -> Dict:
+    @functools.cached_property
+    def dxt_manifest(self) -> DXTManifest:
+        """DXT manifest, loaded on first use so Docker-only actions never read it."""
+        return self._load_dxt_manifest()
+
+    def _load_dxt_manifest(self) -> DXTManifest:
         """Load DXT manifest file."""
-        manifest_path = self.project_root / "dxt" / "manifest.json"
-        if not manifest_path.exists():
+        manifest_path = self.paths.manifest
+        if manifest_path.name not in self._dxt_entries():
             raise FileNotFoundError(f"DXT manifest not found: {manifest_path}")
 
-        with open(manifest_path, 'r') as f:
-            return json.load(f)
+        data = json.loads(manifest_path.read_bytes())
+        return DXTManifest(**{f.name: data[f.name] for f in fields(DXTManifest) if f.name in data})
 
     def check_prerequisites(self) -> bool:
         """Check if all prerequisites are met."""
@@ -46,24 +126,22 @@ class DeploymentManager:
             return False
         print(f"✅ Python {python_version.major}.{python_version.minor}.{python_version.micro}")
 
-        # Check HandBrake CLI
-        try:
-            result = subprocess.run(['HandBrakeCLI', '--version'],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ HandBrake CLI found: {result.stdout.strip()}")
-            else:
+        # Probe external tools concurrently; wall time is the slowest probe
+        versions = asyncio.run(probe_all(PREREQUISITE_PROBES))
+        for (label, _), version in zip(PREREQUISITE_PROBES, versions, strict=True):
+            if version is not None:
+                print(f"✅ {label} found: {version}")
+            elif label == "HandBrake CLI":
                 print("⚠️  HandBrake CLI not found in PATH")
                 print("   Please install HandBrake CLI or set HBB_PATH environment variable")
-        except FileNotFoundError:
-            print("⚠️  HandBrake CLI not found in PATH")
-            print("   Please install HandBrake CLI or set HBB_PATH environment variable")
+            else:
+                print(f"⚠️  {label} not found in PATH")
 
         # Check DXT package
-        dxt_package = self.project_root / "dist" / f"handbrake-mcp-{self.dxt_manifest['version']}.dxt"
+        dxt_package = self.paths.dist / f"handbrake-mcp-{self.dxt_manifest.version}.dxt"
         if dxt_package.exists():
             size_mb = dxt_package.stat().st_size / (1024 * 1024)
-            print(f"✅ DXT package found: {size_mb:.1f".1f"B")
+            print(f"✅ DXT package found: {size_mb:.1f}MB")
         else:
             print("⚠️  DXT package not found. Run build script first.")
 
@@ -74,8 +152,8 @@ class DeploymentManager:
         print("Building DXT package...")
 
         # Check if virtual environment exists
-        venv_path = self.project_root / "dxt" / "venv"
-        if not venv_path.exists():
+        venv_path = self.paths.venv
+        if venv_path.name not in self._dxt_entries():
             print("Setting up virtual environment...")
             if not self.setup_venv():
                 return False
@@ -101,30 +179,42 @@ class DeploymentManager:
         """Set up virtual environment."""
         print("Setting up virtual environment...")
 
-        venv_path = self.project_root / "dxt" / "venv"
-        setup_script = self.project_root / "dxt" / "setup-venv.py"
+        venv_path = self.paths.venv
+        setup_script = self.paths.setup_script
+        dxt_entries = self._dxt_entries()
 
-        if setup_script.exists():
+        if setup_script.name in dxt_entries:
             result = subprocess.run([sys.executable, str(setup_script)],
                                   cwd=self.project_root)
             return result.returncode == 0
         else:
-            # Manual venv setup
-            result = subprocess.run([sys.executable, "-m", "venv", str(venv_path)],
-                                  cwd=self.project_root)
+            # Manual venv setup; prefer uv, which resolves and installs in parallel
+            uv_path = shutil.which("uv")
+            if uv_path:
+                venv_cmd = [uv_path, "venv", str(venv_path)]
+            else:
+                venv_cmd = [sys.executable, "-m", "venv", str(venv_path)]
+            result = subprocess.run(venv_cmd, cwd=self.project_root)
             if result.returncode != 0:
                 return False
 
             # Install requirements
-            if os.name == 'nt':  # Windows
-                pip_path = venv_path / "Scripts" / "pip.exe"
-            else:  # Unix/Linux
-                pip_path = venv_path / "bin" / "pip"
-
-            requirements_path = self.project_root / "dxt" / "requirements-dxt.txt"
-            if requirements_path.exists():
-                result = subprocess.run([str(pip_path), "install", "-r", str(requirements_path)],
-                                      cwd=self.project_root)
+            requirements_path = self.paths.requirements
+            if requirements_path.name in dxt_entries:
+                if uv_path:
+                    if os.name == 'nt':  # Windows
+                        python_path = venv_path / "Scripts" / "python.exe"
+                    else:  # Unix/Linux
+                        python_path = venv_path / "bin" / "python"
+                    install_cmd = [uv_path, "pip", "install", "--python", str(python_path),
+                                   "-r", str(requirements_path)]
+                else:
+                    if os.name == 'nt':  # Windows
+                        pip_path = venv_path / "Scripts" / "pip.exe"
+                    else:  # Unix/Linux
+                        pip_path = venv_path / "bin" / "pip"
+                    install_cmd = [str(pip_path), "install", "-r", str(requirements_path)]
+                result = subprocess.run(install_cmd, cwd=self.project_root)
                 return result.returncode == 0
 
         return True
@@ -141,7 +231,7 @@ class DeploymentManager:
         # Create example config
         config_path = Path("config") / "handbrake-mcp.yml"
         if not config_path.exists():
-            config_content = f"""# HandBrake MCP Configuration
+            config_content = """# HandBrake MCP Configuration
 server:
   host: "127.0.0.1"
   port: 8000
@@ -162,8 +252,7 @@ notifications:
   webhook_url: ""
   email_recipients: []
 """
-            with open(config_path, 'w') as f:
-                f.write(config_content)
+            config_path.write_text(config_content, encoding="utf-8")
             print(f"✅ Created example configuration: {config_path}")
 
         # Build package if needed
@@ -237,7 +326,7 @@ notifications:
         """Create a release."""
         print("Creating release...")
 
-        version = self.dxt_manifest.get('version', '0.1.0')
+        version = self.dxt_manifest.version
         print(f"Creating release v{version}")
 
         # Create git tag
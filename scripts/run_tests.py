@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 """Test runner for HandBrake MCP with flexible test execution."""
 import argparse
+import functools
+import os
 import subprocess
 import sys
 from pathlib import Path
 
-def check_handbrake():
-    """Check if HandBrakeCLI is available."""
+@functools.lru_cache(maxsize=1)
+def handbrake_version():
+    """Return the HandBrakeCLI version line, or None if unavailable (probed once per process)."""
     try:
         result = subprocess.run(
             ["HandBrakeCLI", "--version"],
@@ -14,9 +17,22 @@ def check_handbrake():
             text=True,
             timeout=5
         )
-        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        return False
+        return None
+    if result.returncode != 0:
+        return None
+    output = result.stdout.strip()
+    return output.splitlines()[0] if output else ""
+
+def check_handbrake():
+    """Check if HandBrakeCLI is available."""
+    return handbrake_version() is not None
+
+def export_handbrake_probe():
+    """Share the probe result with the pytest process so conftest doesn't re-run it."""
+    version = handbrake_version()
+    os.environ["HBMCP_HANDBRAKE_AVAILABLE"] = "0" if version is None else "1"
+    os.environ["HBMCP_HANDBRAKE_VERSION"] = version or ""
 
 def run_tests(test_type="unit", verbose=True, coverage=True):
     """Run tests with specified configuration."""
@@ -94,6 +110,9 @@ Test Types:
         else:
             print("⚠️  HandBrakeCLI not found, skipping integration tests")
 
+    if args.test_type != "unit":
+        export_handbrake_probe()
+
     # Run tests
     success = run_tests(
         test_type=args.test_type,
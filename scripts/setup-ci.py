@@ -7,99 +7,99 @@ This script helps set up the CI/CD pipeline and validates the configuration.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+REQUIRED_WORKFLOWS = (
+    "ci.yml",
+    "version-management.yml",
+    "dependency-updates.yml",
+    "docker.yml"
+)
+
+REQUIRED_K8S_FILES = (
+    "deployment.yml",
+    "service.yml",
+    "ingress.yml",
+    "pvc.yml",
+    "configmap.yml"
+)
+
+def dir_entries(directory: Path) -> Optional[Set[str]]:
+    """List a directory with one scandir call; None if it doesn't exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
-def check_github_actions():
+def check_github_actions() -> Tuple[bool, List[str]]:
     """Check GitHub Actions setup."""
-    print("🔍 Checking GitHub Actions...")
-
-    workflows_dir = Path(".github/workflows")
-    if not workflows_dir.exists():
-        print("❌ .github/workflows directory not found")
-        return False
+    output = ["🔍 Checking GitHub Actions..."]
 
-    required_files = [
-        "ci.yml",
-        "version-management.yml",
-        "dependency-updates.yml",
-        "docker.yml"
-    ]
-
-    missing_files = []
-    for file in required_files:
-        if not (workflows_dir / file).exists():
-            missing_files.append(file)
+    workflows = dir_entries(Path(".github/workflows"))
+    if workflows is None:
+        output.append("❌ .github/workflows directory not found")
+        return False, output
 
+    missing_files = [file for file in REQUIRED_WORKFLOWS if file not in workflows]
     if missing_files:
-        print(f"❌ Missing workflow files: {', '.join(missing_files)}")
-        return False
+        output.append(f"❌ Missing workflow files: {', '.join(missing_files)}")
+        return False, output
 
-    print("✅ GitHub Actions workflows found")
-    return True
+    output.append("✅ GitHub Actions workflows found")
+    return True, output
 
-def check_docker_setup():
+def check_docker_setup() -> Tuple[bool, List[str]]:
     """Check Docker setup."""
-    print("🔍 Checking Docker setup...")
+    output = ["🔍 Checking Docker setup..."]
 
-    dockerfile = Path("Dockerfile")
-    if not dockerfile.exists():
-        print("❌ Dockerfile not found")
-        return False
+    root = dir_entries(Path(".")) or set()
+    if "Dockerfile" not in root:
+        output.append("❌ Dockerfile not found")
+        return False, output
 
-    docker_compose = Path("docker-compose.yml")
-    if not docker_compose.exists():
-        print("⚠️  docker-compose.yml not found (optional)")
+    if "docker-compose.yml" not in root:
+        output.append("⚠️  docker-compose.yml not found (optional)")
 
-    print("✅ Docker setup found")
-    return True
+    output.append("✅ Docker setup found")
+    return True, output
 
-def check_kubernetes_setup():
+def check_kubernetes_setup() -> Tuple[bool, List[str]]:
     """Check Kubernetes setup."""
-    print("🔍 Checking Kubernetes setup...")
-
-    k8s_dir = Path("k8s")
-    if not k8s_dir.exists():
-        print("⚠️  k8s directory not found (optional)")
-        return True
-
-    required_k8s_files = [
-        "deployment.yml",
-        "service.yml",
-        "ingress.yml",
-        "pvc.yml",
-        "configmap.yml"
-    ]
+    output = ["🔍 Checking Kubernetes setup..."]
 
-    missing_files = []
-    for file in required_k8s_files:
-        if not (k8s_dir / file).exists():
-            missing_files.append(file)
+    k8s_files = dir_entries(Path("k8s"))
+    if k8s_files is None:
+        output.append("⚠️  k8s directory not found (optional)")
+        return True, output
 
+    missing_files = [file for file in REQUIRED_K8S_FILES if file not in k8s_files]
     if missing_files:
-        print(f"⚠️  Missing Kubernetes files: {', '.join(missing_files)}")
+        output.append(f"⚠️  Missing Kubernetes files: {', '.join(missing_files)}")
     else:
-        print("✅ Kubernetes setup found")
+        output.append("✅ Kubernetes setup found")
 
-    return True
+    return True, output
 
-def check_monitoring_setup():
+def check_monitoring_setup() -> Tuple[bool, List[str]]:
     """Check monitoring setup."""
-    print("🔍 Checking monitoring setup...")
+    output = ["🔍 Checking monitoring setup..."]
 
     monitoring_dir = Path("monitoring")
-    if not monitoring_dir.exists():
-        print("⚠️  monitoring directory not found (optional)")
-        return True
+    monitoring = dir_entries(monitoring_dir)
+    if monitoring is None:
+        output.append("⚠️  monitoring directory not found (optional)")
+        return True, output
 
-    prometheus_config = monitoring_dir / "prometheus.yml"
-    if prometheus_config.exists():
-        print("✅ Prometheus configuration found")
+    if "prometheus.yml" in monitoring:
+        output.append("✅ Prometheus configuration found")
 
-    grafana_provisioning = monitoring_dir / "grafana" / "provisioning"
-    if grafana_provisioning.exists():
-        print("✅ Grafana provisioning found")
+    if "grafana" in monitoring and "provisioning" in (dir_entries(monitoring_dir / "grafana") or set()):
+        output.append("✅ Grafana provisioning found")
 
-    return True
+    return True, output
 
 def validate_ci_cd_setup():
     """Validate the complete CI/CD setup."""
@@ -113,14 +113,20 @@ def validate_ci_cd_setup():
         check_monitoring_setup
     ]
 
+    # Checks are independent, so run them concurrently and report in order
     all_passed = True
-    for check in checks:
-        try:
-            if not check():
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(check, executor.submit(check)) for check in checks]
+        for check, future in futures:
+            try:
+                passed, output = future.result()
+            except Exception as e:
+                print(f"❌ Error during {check.__name__}: {e}")
+                all_passed = False
+                continue
+            print("\n".join(output))
+            if not passed:
                 all_passed = False
-        except Exception as e:
-            print(f"❌ Error during {check.__name__}: {e}")
-            all_passed = False
 
     print("=" * 50)
     if all_passed:
@@ -1,10 +1,9 @@
 """API v1 endpoints for HandBrake MCP."""
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional, Union
 
-from handbrake_mcp.services.handbrake import handbrake_service, TranscodeJob
+from handbrake_mcp.services.handbrake import failed_entry_id, get_handbrake_service, TranscodeJob
 from handbrake_mcp.core.config import settings
 
 router = APIRouter()
@@ -24,6 +23,11 @@ class TranscodeRequest(BaseModel):
     )
 
 
+class BatchTranscodeRequest(BaseModel):
+    """Request model for starting several transcode jobs at once."""
+    jobs: List[TranscodeRequest] = Field(..., min_length=1, description="Transcode jobs to queue")
+
+
 class JobStatusResponse(BaseModel):
     """Response model for job status."""
     job_id: str
@@ -38,7 +42,7 @@ class JobStatusResponse(BaseModel):
 async def start_transcode(request: TranscodeRequest):
     """Start a new video transcode job."""
     try:
-        job_id = await handbrake_service.transcode(
+        job_id = await get_handbrake_service().transcode(
             input_path=request.input_path,
             output_path=request.output_path,
             preset=request.preset,
@@ -52,23 +56,54 @@ async def start_transcode(request: TranscodeRequest):
         )
 
 
+@router.post("/transcode/batch", response_model=List[Dict[str, str]])
+async def start_batch_transcode(request: BatchTranscodeRequest):
+    """Start several transcode jobs in one request.
+
+    Results are returned in request order, with the same entries as the
+    batch_transcode MCP tool: a job that fails to queue gets a ``failed`` entry
+    with an ``error_N`` ID and the error instead of failing the whole batch.
+    """
+    outcomes = await get_handbrake_service().transcode_many(
+        [job.model_dump() for job in request.jobs]
+    )
+    return [
+        {
+            "job_id": failed_entry_id(),
+            "status": "failed",
+            "input_path": job.input_path,
+            "output_path": job.output_path,
+            "error": str(outcome),
+        }
+        if isinstance(outcome, Exception)
+        else {
+            "job_id": outcome,
+            "status": "queued",
+            "input_path": job.input_path,
+            "output_path": job.output_path,
+        }
+        for job, outcome in zip(request.jobs, outcomes, strict=True)
+    ]
+
+
 @router.get("/jobs/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str):
     """Get the status of a transcode job."""
-    job = await handbrake_service.get_job_status(job_id)
+    job = await get_handbrake_service().get_job_status(job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found"
         )
     
-    return JobStatusResponse(
+    # Trusted service data; FastAPI validates it once more against response_model
+    return JobStatusResponse.model_construct(
         job_id=job.job_id,
         status=job.status,
         progress=job.progress,
         error=job.error,
-        input_path=str(job.input_path),
-        output_path=str(job.output_path),
+        input_path=job.input_path_str,
+        output_path=job.output_path_str,
     )
 
 
@@ -76,7 +111,7 @@ async def get_job_status(job_id: str):
 async def list_presets():
     """List available HandBrake presets."""
     try:
-        return await handbrake_service.get_presets()
+        return await get_handbrake_service().get_presets()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -87,10 +122,9 @@ async def list_presets():
 @router.delete("/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def cancel_job(job_id: str):
     """Cancel a running transcode job."""
-    success = await handbrake_service.cancel_job(job_id)
+    success = await get_handbrake_service().cancel_job(job_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found or not running"
         )
-    return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
@@ -1,8 +1,27 @@
+import fnmatch
+import os
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_VALID_LOG_LEVELS = frozenset({"debug", "info", "warning", "error", "critical"})
+
+# Events emitted by the processing service
+_WEBHOOK_EVENTS = frozenset({"job_started", "job_completed", "job_failed"})
+
+
+def compile_file_patterns(patterns: list[str]) -> re.Pattern:
+    """Combine glob patterns into one regex matched against a file name.
+
+    An empty list matches nothing, just as any() over no patterns would.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -17,11 +36,19 @@ class Settings(BaseSettings):
     mcp_transport: str = "stdio"
     mcp_host: str = "127.0.0.1"
     mcp_port: int = 10875
+    # Decorate help/status text with emoji; disable for clients that render them as tofu
+    rich_output: bool = Field(
+        True, validation_alias=AliasChoices("rich_output", "handbrake_mcp_rich")
+    )
 
     # HandBrake configuration
     hbb_path: str = "HandBrakeCLI"
     winget_hbb_path: str = "C:/Users/sandr/AppData/Local/Microsoft/WinGet/Links/HandBrakeCLI.exe"
     default_preset: str = "Fast 1080p30"
+    # Encodes run at once; also sizes the watch folder worker pool
+    max_concurrent_jobs: int = Field(5, gt=0)
+    # Threads for blocking filesystem/psutil calls, kept off the event loop
+    io_workers: int = Field(4, gt=0)
 
     # Watch folder configuration
     watch_folders: list[Path] = Field(default_factory=list)
@@ -30,6 +57,9 @@ class Settings(BaseSettings):
     file_patterns: list[str] = Field(
         default_factory=lambda: ["*.mp4", "*.mkv", "*.avi", "*.mov", "*.m4v"]
     )
+    # Native filesystem events miss changes on network mounts (NFS/SMB); poll those instead
+    watch_use_polling: bool = False
+    watch_poll_interval: float = Field(30.0, gt=0, description="Seconds between polls")
 
     # Notification configuration
     webhook_url: str | None = None
@@ -54,6 +84,11 @@ class Settings(BaseSettings):
         env_prefix="",  # Allow environment variables without prefix
     )
 
+    @cached_property
+    def compiled_file_pattern(self) -> re.Pattern:
+        """File patterns compiled into a single regex."""
+        return compile_file_patterns(self.file_patterns)
+
     @field_validator("watch_folders", mode="before")
     @classmethod
     def parse_watch_folders(cls, v):
@@ -67,21 +102,29 @@ class Settings(BaseSettings):
     def parse_webhook_events(cls, v):
         """Parse webhook events from comma-separated string."""
         if isinstance(v, str):
-            return [event.strip() for event in v.split(",") if event.strip()]
-        return v or []
+            v = [event.strip() for event in v.split(",") if event.strip()]
+        events = v or []
+        unknown = [event for event in events if event not in _WEBHOOK_EVENTS]
+        if unknown:
+            raise ValueError(
+                f"Invalid webhook events: {', '.join(unknown)}. "
+                f"Must be any of: {', '.join(sorted(_WEBHOOK_EVENTS))}"
+            )
+        return events
 
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
-        valid_levels = ["debug", "info", "warning", "error", "critical"]
-        if v.lower() not in valid_levels:
-            raise ValueError(f"Invalid log level. Must be one of: {', '.join(valid_levels)}")
-        return v.lower()
+        level = v.lower()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log level. Must be one of: {', '.join(sorted(_VALID_LOG_LEVELS))}")
+        return level
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Settings:
-    """Get application settings."""
+    """Get application settings (built once per process)."""
     return Settings()
 
 
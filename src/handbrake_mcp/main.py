@@ -1,17 +1,14 @@
 """Main FastMCP application for HandBrake MCP server."""
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, status
-from fastapi.middleware.cors import CORSMiddleware
-
 from handbrake_mcp.core.config import settings
 from handbrake_mcp.services.notification_service import notification_service
 from handbrake_mcp.services.processing_service import processing_service
 from handbrake_mcp.services.watch_service import watch_service
-from handbrake_mcp.stdio_main import mcp
-import psutil
 import time
 import subprocess
 from pydantic import BaseModel
@@ -23,35 +20,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="HandBrake MCP Server",
-    description="FastMCP 2.12.0 compliant server for video transcoding with HandBrake",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# FastMCP instance for stdio mode is in stdio_main.py
-
-# MCP tools are not used in the main FastAPI server
-
-# Include API routers
-# from handbrake_mcp.api.v1.endpoints import router as api_router
-# app.include_router(api_router, prefix="/api/v1")
-
-# Mount MCP app for HTTP access
-app.mount("/mcp", mcp.app)
-
 
 async def process_new_file(file_path: Path):
     """Process a new file detected by the watch service."""
@@ -68,38 +36,40 @@ async def process_new_file(file_path: Path):
         logger.error(f"Error processing file {file_path}: {e}")
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application services on startup."""
-    logger.info("Starting HandBrake MCP server...")
+async def _start_watch_folders():
+    """Start the watch service for the configured folders, if any."""
+    if not settings.watch_folders:
+        return
+    logger.info(
+        f"Watching folders: {', '.join(str(f) for f in settings.watch_folders)}"
+    )
+    await watch_service.start(
+        callback=process_new_file,
+        watch_dirs=settings.watch_folders,
+    )
 
-    # Initialize notification service
-    await notification_service.initialize()
 
-    # Initialize watch folders
-    if settings.watch_folders:
-        logger.info(
-            f"Watching folders: {', '.join(str(f) for f in settings.watch_folders)}"
-        )
-        await watch_service.start(
-            callback=process_new_file,
-            watch_dirs=settings.watch_folders,
-        )
+async def _stop_watch_service():
+    """Stop the watch service if it is running."""
+    if watch_service.is_running():
+        await watch_service.stop()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Initialize application services on startup and clean them up on shutdown."""
+    logger.info("Starting HandBrake MCP server...")
+
+    # Notifications and watch folders are independent, so start them together
+    await asyncio.gather(notification_service.initialize(), _start_watch_folders())
 
     logger.info("HandBrake MCP server started successfully")
 
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on shutdown."""
     logger.info("Shutting down HandBrake MCP server...")
 
-    # Stop the watch service
-    if watch_service.is_running():
-        await watch_service.stop()
-
-    # Shut down the notification service
-    await notification_service.shutdown()
+    await asyncio.gather(_stop_watch_service(), notification_service.shutdown())
 
     logger.info("HandBrake MCP server has been shut down")
 
@@ -108,18 +78,8 @@ async def main():
     """Main stdio server function."""
     logger.info("Starting HandBrake MCP server (stdio mode)...")
 
-    # Initialize notification service
-    await notification_service.initialize()
-
-    # Initialize watch folders
-    if settings.watch_folders:
-        logger.info(
-            f"Watching folders: {', '.join(str(f) for f in settings.watch_folders)}"
-        )
-        await watch_service.start(
-            callback=process_new_file,
-            watch_dirs=settings.watch_folders,
-        )
+    # Notifications and watch folders are independent, so start them together
+    await asyncio.gather(notification_service.initialize(), _start_watch_folders())
 
     logger.info("HandBrake MCP server started successfully")
 
@@ -128,9 +88,10 @@ async def main():
 
 
 # Health check endpoint with system metrics
-@app.get("/health", status_code=status.HTTP_200_OK)
 async def health_check() -> dict:
     """Health check endpoint with system metrics."""
+    import psutil
+
     return {
         "status": "ok",
         "version": "0.1.0",
@@ -147,7 +108,6 @@ class LaunchRequest(BaseModel):
     repo_path: str
 
 
-@app.post("/api/fleet/launch")
 async def launch_app(request: LaunchRequest):
     """Launch another MCP app via its start.ps1 script."""
     path = Path(request.repo_path)
@@ -200,6 +160,56 @@ async def launch_app(request: LaunchRequest):
 # MCP tools are registered in stdio_main.py for stdio mode from tools.utility_tools
 
 
+def _build_http_app():
+    """Build the FastAPI app for HTTP mode."""
+    from fastapi import FastAPI, status
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from handbrake_mcp.stdio_main import mcp
+
+    app = FastAPI(
+        title="HandBrake MCP Server",
+        description="FastMCP 2.12.0 compliant server for video transcoding with HandBrake",
+        version="0.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan,
+    )
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # FastMCP instance for stdio mode is in stdio_main.py
+
+    # Include API routers
+    # from handbrake_mcp.api.v1.endpoints import router as api_router
+    # app.include_router(api_router, prefix="/api/v1")
+
+    # Mount MCP app for HTTP access
+    app.mount("/mcp", mcp.app)
+
+    app.add_api_route("/health", health_check, methods=["GET"], status_code=status.HTTP_200_OK)
+    app.add_api_route("/api/fleet/launch", launch_app, methods=["POST"])
+    return app
+
+
+def __getattr__(name):
+    """Build ``app`` on first access (e.g. uvicorn handbrake_mcp.main:app).
+
+    Stdio mode never touches it, so it never pays for importing FastAPI.
+    """
+    if name == "app":
+        app = globals()["app"] = _build_http_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # For DXT compatibility and dual mode support
 if __name__ == "__main__":
     # When run as a module (python -m handbrake_mcp.main), always run in stdio mode for MCP clients
@@ -332,8 +332,8 @@ async def list_jobs():
         for job_id, job in hb.jobs.items():
             job_list.append({
                 "job_id": job.job_id,
-                "input": str(job.input_path),
-                "output": str(job.output_path),
+                "input": job.input_path_str,
+                "output": job.output_path_str,
                 "preset": job.preset,
                 "status": job.status,
                 "progress": job.progress,
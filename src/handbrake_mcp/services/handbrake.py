@@ -1,18 +1,49 @@
 """HandBrake service for video transcoding."""
 import asyncio
+import itertools
 import json
 import logging
+import os
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from handbrake_mcp.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Job states that count against the service's queue limit
+_PENDING_STATUSES = frozenset({"queued", "processing"})
+# Final job states; a job that reaches one never changes again
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+T = TypeVar("T")
+
+# Blocking filesystem and psutil calls run here so a slow disk or network
+# share can't stall every other tool call on the event loop
+_io_executor = ThreadPoolExecutor(max_workers=settings.io_workers, thread_name_prefix="handbrake-io")
+
+
+async def run_io(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call on the shared I/O thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_io_executor, func, *args)
+
+
+# IDs for batch entries that never became jobs, unique across batches and
+# shared by the MCP tools and the REST API
+_failed_entry_ids = itertools.count(1)
+
+
+def failed_entry_id() -> str:
+    """Return a fresh ID for a batch entry that failed to queue."""
+    return f"error_{next(_failed_entry_ids)}"
+
 
 class HandBrakeError(Exception):
     """Custom exception for HandBrake related errors."""
@@ -32,6 +63,17 @@ class TranscodeJob(BaseModel):
     progress: float = 0.0
     error: Optional[str] = None
     process: Optional[asyncio.subprocess.Process] = None
+    _done: asyncio.Event = PrivateAttr(default_factory=asyncio.Event)
+
+    @cached_property
+    def input_path_str(self) -> str:
+        """Input path as a string, converted once per job for status polling."""
+        return os.fspath(self.input_path)
+
+    @cached_property
+    def output_path_str(self) -> str:
+        """Output path as a string, converted once per job for status polling."""
+        return os.fspath(self.output_path)
 
 
 class HandBrakeService:
@@ -42,11 +84,40 @@ class HandBrakeService:
         self.handbrake_version = None
         self.jobs: Dict[str, TranscodeJob] = {}
         self._supported_presets: List[str] = []
-        self._max_concurrent_jobs = 5  # Rate limiting
+        self._presets_loaded_at = 0.0
+        self._presets_ttl_seconds = 3600  # Presets only change with a HandBrakeCLI upgrade
+        self._presets_lock = asyncio.Lock()
+        self._version_lock = asyncio.Lock()
+        self._max_concurrent_jobs = settings.max_concurrent_jobs  # Rate limiting
+        self._max_pending_jobs = 2 * self._max_concurrent_jobs  # Queued + processing cap
+        self._job_slots = asyncio.Semaphore(self._max_concurrent_jobs)  # Running encodes
+        self._active_jobs = 0  # Jobs in "processing", maintained by _set_job_status
+        self._pending_jobs = 0  # Jobs "queued" or "processing", maintained the same way
         self._max_file_size_gb = 10  # Maximum file size in GB
         self._min_file_size_bytes = 1024  # Minimum file size in bytes
         self._max_option_value_length = 1000  # Maximum length for option values
     
+    @property
+    def active_jobs(self) -> int:
+        """Number of jobs currently processing."""
+        return self._active_jobs
+
+    def _set_job_status(self, job: TranscodeJob, status: str) -> None:
+        """Update a job's status, keeping the active and pending job counts in step.
+
+        Terminal statuses are final: once a job is completed, failed or cancelled,
+        later updates (e.g. the runner seeing a cancelled process exit) are ignored.
+        """
+        if job.status in _TERMINAL_STATUSES:
+            return
+        was_active = job.status == "processing"
+        was_pending = job.status in _PENDING_STATUSES
+        job.status = status
+        self._active_jobs += (status == "processing") - was_active
+        self._pending_jobs += (status in _PENDING_STATUSES) - was_pending
+        if status in _TERMINAL_STATUSES:
+            job._done.set()
+
     def _find_handbrake(self) -> Path:
         """Find HandBrakeCLI in the system PATH or use configured path."""
         # 1. Check standard PATH/configured path
@@ -67,8 +138,14 @@ class HandBrakeService:
         return Path(handbrake_path)
     
     async def get_handbrake_version(self) -> str:
-        """Get the HandBrake CLI version."""
-        if self.handbrake_version is None:
+        """Get the HandBrake CLI version (queried once per service)."""
+        if self.handbrake_version is not None:
+            return self.handbrake_version
+
+        # Concurrent first callers wait for a single HandBrakeCLI query
+        async with self._version_lock:
+            if self.handbrake_version is not None:
+                return self.handbrake_version
             try:
                 result = await self._run_handbrake(["--version"])
                 # Parse version from output like "HandBrake 1.5.1 (2023010100)"
@@ -89,9 +166,27 @@ class HandBrakeService:
                 self.handbrake_version = "unknown"
         return self.handbrake_version
 
+    def _presets_fresh(self) -> bool:
+        """Check whether the cached preset list is still within its TTL."""
+        return bool(self._supported_presets) and (
+            time.monotonic() - self._presets_loaded_at < self._presets_ttl_seconds
+        )
+
+    def invalidate_presets(self) -> None:
+        """Drop the cached preset list so the next lookup re-queries HandBrakeCLI."""
+        self._supported_presets = []
+        self._presets_loaded_at = 0.0
+
     async def get_presets(self) -> List[str]:
-        """Get list of available HandBrake presets."""
-        if not self._supported_presets:
+        """Get list of available HandBrake presets (cached for ``_presets_ttl_seconds``)."""
+        if self._presets_fresh():
+            return self._supported_presets
+
+        # Concurrent callers wait for a single HandBrakeCLI query
+        async with self._presets_lock:
+            if self._presets_fresh():
+                return self._supported_presets
+            self._supported_presets = []
             try:
                 # First get the version to ensure HandBrake is working
                 await self.get_handbrake_version()
@@ -111,6 +206,8 @@ class HandBrakeService:
                     logger.warning("Using fallback preset list")
                     self._supported_presets = ["Fast 1080p30", "HQ 1080p30 Surround", "Web Optimized"]
 
+                self._presets_loaded_at = time.monotonic()
+
             except Exception as e:
                 logger.error(f"Failed to get presets: {e}")
                 raise HandBrakeError(f"Failed to get presets: {e}")
@@ -170,15 +267,65 @@ class HandBrakeService:
             ValueError: If preset is invalid or system overloaded
             HandBrakeError: If HandBrake CLI fails
         """
-        # Security: Validate and canonicalize paths
-        input_path = self._validate_and_secure_path(input_path)
-        output_path = self._validate_and_secure_path(output_path)
+        input_path, output_path, file_size = await run_io(
+            self._resolve_job_paths, input_path, output_path
+        )
+        self._check_file_size(file_size)
+
+        # Check system resources before starting new job
+        await self._check_system_resources()
+
+        # Validate preset if provided
+        if preset and preset not in await self.get_presets():
+            raise ValueError(f"Invalid preset: {preset}")
+
+        return self._enqueue_job(input_path, output_path, preset, options)
+
+    async def transcode_many(
+        self, specs: List[Dict[str, Any]]
+    ) -> List[Union[str, Exception]]:
+        """Start a batch of transcoding jobs, validating shared state only once.
 
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+        Each spec takes the same keys as ``transcode`` (``input_path``,
+        ``output_path`` and optional ``preset``/``options``). System resources
+        and the preset list are checked once for the whole batch, input paths
+        are validated concurrently on the I/O pool, and every accepted job is
+        registered without yielding to the event loop in between.
 
+        Returns:
+            One entry per spec, in order: the job ID, or the exception that
+            rejected that spec (``transcode`` would have raised it)
+        """
+        try:
+            await self._check_system_resources()
+            presets = await self.get_presets() if any(spec.get("preset") for spec in specs) else []
+        except Exception as e:
+            return [e] * len(specs)
+
+        resolved = await asyncio.gather(
+            *(run_io(self._resolve_spec_paths, spec) for spec in specs),
+            return_exceptions=True,
+        )
+
+        results: List[Union[str, Exception]] = []
+        for spec, paths in zip(specs, resolved, strict=True):
+            if isinstance(paths, Exception):
+                results.append(paths)
+                continue
+            input_path, output_path, file_size = paths
+            preset = spec.get("preset")
+            try:
+                self._check_file_size(file_size)
+                if preset and preset not in presets:
+                    raise ValueError(f"Invalid preset: {preset}")
+                results.append(self._enqueue_job(input_path, output_path, preset, spec.get("options")))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _check_file_size(self, file_size: int) -> None:
+        """Apply the input file size limits to a new job."""
         # Validate file size (prevent processing extremely large files)
-        file_size = input_path.stat().st_size
         max_file_size = self._max_file_size_gb * 1024 * 1024 * 1024
         if file_size > max_file_size:
             raise ValueError(f"Input file too large: {file_size / (1024*1024*1024):.1f}GB (max: {self._max_file_size_gb}GB)")
@@ -186,17 +333,22 @@ class HandBrakeService:
         if file_size < self._min_file_size_bytes:
             raise ValueError(f"Input file too small: {file_size} bytes (min: {self._min_file_size_bytes} bytes)")
 
-        # Rate limiting: Check concurrent jobs
-        running_jobs = len([job for job in self.jobs.values() if job.status == "processing"])
-        if running_jobs >= self._max_concurrent_jobs:
-            raise ValueError(f"Maximum concurrent jobs ({self._max_concurrent_jobs}) reached. Please wait for existing jobs to complete.")
-
-        # Check system resources before starting new job
-        await self._check_system_resources()
+    def _enqueue_job(
+        self,
+        input_path: Path,
+        output_path: Path,
+        preset: Optional[str],
+        options: Optional[Dict[str, Union[str, int, float, bool]]],
+    ) -> str:
+        """Register a validated job and start its background task.
 
-        # Validate preset if provided
-        if preset and preset not in await self.get_presets():
-            raise ValueError(f"Invalid preset: {preset}")
+        The queue limit is checked here rather than with the other validation so
+        that checking and claiming a queue slot happen without an await in between;
+        concurrent submissions cannot all pass the check before any of them enqueue.
+        """
+        # Rate limiting: jobs beyond _max_concurrent_jobs wait in the queue, up to a limit
+        if self._pending_jobs >= self._max_pending_jobs:
+            raise ValueError(f"Job queue full ({self._max_pending_jobs} jobs queued or processing). Please wait for existing jobs to complete.")
 
         # Sanitize options to prevent command injection
         safe_options = self._sanitize_options(options or {})
@@ -213,12 +365,31 @@ class HandBrakeService:
         )
 
         self.jobs[job_id] = job
+        self._pending_jobs += 1
 
         # Start the transcoding task
         asyncio.create_task(self._run_transcode_job(job))
 
         return job_id
 
+    def _resolve_job_paths(
+        self, input_path: Union[str, Path], output_path: Union[str, Path]
+    ) -> Tuple[Path, Path, int]:
+        """Validate both job paths and stat the input; blocking, so run via run_io."""
+        # Security: Validate and canonicalize paths
+        input_path = self._validate_and_secure_path(input_path)
+        output_path = self._validate_and_secure_path(output_path)
+
+        try:
+            file_size = input_path.stat().st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {input_path}") from None
+        return input_path, output_path, file_size
+
+    def _resolve_spec_paths(self, spec: Dict[str, Any]) -> Tuple[Path, Path, int]:
+        """``_resolve_job_paths`` for a ``transcode_many`` spec; blocking, so run via run_io."""
+        return self._resolve_job_paths(spec["input_path"], spec["output_path"])
+
     def _validate_and_secure_path(self, path: Union[str, Path]) -> Path:
         """Validate and secure file path to prevent directory traversal attacks."""
         # Convert to string for validation
@@ -318,8 +489,8 @@ class HandBrakeService:
             logger.warning("psutil not available - skipping resource checks")
             return
 
-        # Check CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Check CPU usage; sampling blocks for the whole interval, so keep it off the event loop
+        cpu_percent = await run_io(psutil.cpu_percent, 1)
         if cpu_percent > 90:
             raise ValueError(f"System CPU usage too high: {cpu_percent:.1f}% (threshold: 90%)")
 
@@ -338,9 +509,16 @@ class HandBrakeService:
             pass
     
     async def _run_transcode_job(self, job: TranscodeJob):
-        """Run a transcoding job in the background."""
+        """Run a transcoding job in the background, once one of the job slots is free."""
+        async with self._job_slots:
+            # The job may have been cancelled (or already run) while waiting for a slot
+            if job.status == "queued":
+                await self._execute_transcode_job(job)
+
+    async def _execute_transcode_job(self, job: TranscodeJob):
+        """Run HandBrakeCLI for a job and record the outcome."""
         try:
-            job.status = "processing"
+            self._set_job_status(job, "processing")
             
             # Prepare output directory
             job.output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -388,39 +566,69 @@ class HandBrakeService:
             # Wait for process to complete
             await process.wait()
             
-            if process.returncode == 0:
-                job.status = "completed"
+            if job.status == "cancelled":
+                logger.info(f"Transcoding cancelled: {job.job_id}")
+            elif process.returncode == 0:
+                self._set_job_status(job, "completed")
                 job.progress = 100.0
                 logger.info(f"Transcoding completed: {job.job_id}")
             else:
                 error_output = await process.stderr.read()
-                job.status = "failed"
+                self._set_job_status(job, "failed")
                 job.error = f"HandBrakeCLI failed with code {process.returncode}: {error_output.decode()}"
                 logger.error(f"Transcoding failed: {job.job_id} - {job.error}")
         
         except Exception as e:
-            job.status = "failed"
+            self._set_job_status(job, "failed")
             job.error = str(e)
             logger.exception(f"Error in transcode job {job.job_id}")
     
     async def get_job_status(self, job_id: str) -> Optional[TranscodeJob]:
         """Get the status of a transcoding job."""
         return self.jobs.get(job_id)
+
+    async def get_job_statuses(self, job_ids: List[str]) -> List[Optional[TranscodeJob]]:
+        """Get several transcoding jobs at once, with None for unknown job IDs."""
+        jobs = self.jobs
+        return [jobs.get(job_id) for job_id in job_ids]
     
+    async def wait_for_job(self, job_id: str, timeout: Optional[float] = None) -> Optional[TranscodeJob]:
+        """Wait until a job reaches a terminal status, or until timeout seconds pass.
+
+        Returns the job either way (check its status to tell the two apart),
+        or None if the job ID is unknown.
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        try:
+            await asyncio.wait_for(job._done.wait(), timeout)
+        except TimeoutError:
+            pass
+        return job
+
     async def cancel_job(self, job_id: str) -> bool:
-        """Cancel a running transcoding job."""
+        """Cancel a queued or running transcoding job."""
         job = self.jobs.get(job_id)
-        if not job or not job.process:
+        if not job:
             return False
-        
+
+        # Still waiting for a job slot: _run_transcode_job skips it once it gets one
+        if job.status == "queued":
+            self._set_job_status(job, "cancelled")
+            return True
+
+        if job.status != "processing" or not job.process:
+            return False
+
+        # Mark it first so the runner's "failed" for the terminated process is ignored
+        self._set_job_status(job, "cancelled")
         try:
             job.process.terminate()
             await asyncio.wait_for(job.process.wait(), timeout=5.0)
         except (ProcessLookupError, asyncio.TimeoutError):
             job.process.kill()
             await job.process.wait()
-        
-        job.status = "cancelled"
         return True
     
     async def _run_handbrake(self, args: List[str]) -> str:
@@ -178,8 +178,8 @@ class ProcessingService:
                 "job_id": job.job_id,
                 "status": job.status,
                 "progress": job.progress,
-                "input_path": str(job.input_path),
-                "output_path": str(job.output_path),
+                "input_path": job.input_path_str,
+                "output_path": job.output_path_str,
             }
             for job in self.active_jobs.values()
         ]
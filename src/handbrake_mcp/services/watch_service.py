@@ -1,13 +1,15 @@
 """Watch folder service for automatic video processing."""
 import asyncio
 import logging
+import os
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
-from handbrake_mcp.core.config import settings
+from handbrake_mcp.core.config import compile_file_patterns, settings
 
 logger = logging.getLogger(__name__)
 
@@ -15,15 +17,30 @@ logger = logging.getLogger(__name__)
 class WatchHandler(FileSystemEventHandler):
     """Handler for file system events."""
     
-    def __init__(self, callback: Callable[[Path], None], patterns: Optional[List[str]] = None):
+    def __init__(
+        self,
+        callback: Callable[[Path], Optional[Awaitable[None]]],
+        patterns: Optional[List[str]] = None,
+        *,
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+    ):
         """Initialize the handler.
         
         Args:
-            callback: Function to call when a matching file is created
-            patterns: List of file patterns to watch (e.g., ['*.mp4', '*.mkv'])
+            callback: Function (sync or async) to call when a matching file is created
+            patterns: List of file patterns to watch (e.g., ['*.mp4', '*.mkv']);
+                defaults to the configured file_patterns
+            queue: Queue drained by the watch service's workers
+            loop: Event loop that owns the queue
         """
         self.callback = callback
-        self.patterns = patterns or ['*.mp4', '*.mkv', '*.avi', '*.mov', '*.m4v']
+        self._queue = queue
+        self._loop = loop
+        self._debounce_seconds = 0.5  # Quiet period after the last event for a path
+        self._pending: Dict[Path, asyncio.TimerHandle] = {}
+        self.patterns = patterns or settings.file_patterns
+        self._pattern = compile_file_patterns(patterns) if patterns else settings.compiled_file_pattern
         self.processed_files: Set[Path] = set()
     
     def on_created(self, event):
@@ -32,15 +49,47 @@ class WatchHandler(FileSystemEventHandler):
             return
 
         file_path = Path(event.src_path)
-        # Use asyncio.create_task to handle the async operation
-        asyncio.create_task(self._handle_new_file(file_path))
+        # watchdog calls this from its observer thread, so hand off to the event loop
+        self._loop.call_soon_threadsafe(self._debounce, file_path, True)
 
-    async def _handle_new_file(self, file_path: Path):
+    def on_modified(self, event):
+        """Called when a file or directory is modified."""
+        if event.is_directory:
+            return
+
+        self._loop.call_soon_threadsafe(self._debounce, Path(event.src_path), False)
+
+    def _debounce(self, file_path: Path, created: bool):
+        """(Re)start the quiet-period timer for a newly created file.
+
+        Writes to a new file emit a burst of modify events; only the last one
+        queues the file. Modifications to files that weren't just created are ignored.
+        """
+        handle = self._pending.pop(file_path, None)
+        if handle is None and not created:
+            return
+        if handle is not None:
+            handle.cancel()
+        self._pending[file_path] = self._loop.call_later(
+            self._debounce_seconds, self._enqueue, file_path
+        )
+
+    def _enqueue(self, file_path: Path):
+        """Queue a file for the workers, dropping it if the queue is full."""
+        self._pending.pop(file_path, None)
+        try:
+            self._queue.put_nowait((self, file_path))
+        except asyncio.QueueFull:
+            logger.warning(f"Watch queue full, dropping new file: {file_path}")
+
+    async def handle_new_file(self, file_path: Path):
         """Handle a new file asynchronously."""
         if await self._should_process(file_path):
             logger.info(f"New file detected: {file_path}")
             self.processed_files.add(file_path)
-            self.callback(file_path)
+            result = self.callback(file_path)
+            if asyncio.iscoroutine(result):
+                await result
 
     async def _should_process(self, file_path: Path) -> bool:
         """Check if a file should be processed."""
@@ -49,7 +98,7 @@ class WatchHandler(FileSystemEventHandler):
             return False
         
         # Check file extension
-        if not any(file_path.match(p) for p in self.patterns):
+        if not self._pattern.match(os.path.normcase(file_path.name)):
             return False
         
         # Check if file is fully written (not being downloaded)
@@ -67,11 +116,35 @@ class WatchService:
     
     def __init__(self):
         """Initialize the watch service."""
-        self.observer = Observer()
+        # Observer uses the OS-native backend (inotify, FSEvents, ReadDirectoryChangesW)
+        if settings.watch_use_polling:
+            self.observer = PollingObserver(timeout=settings.watch_poll_interval)
+        else:
+            self.observer = Observer()
         self.handlers: Dict[Path, WatchHandler] = {}
         self.running = False
-    
-    async def start(self, callback: Callable[[Path], None], watch_dirs: List[Path], patterns: Optional[List[str]] = None):
+        self._worker_count = settings.max_concurrent_jobs  # One worker per encode slot
+        self._max_queued_files = 1024  # Backpressure for bursts of new files
+        self._queue: Optional[asyncio.Queue[Tuple[WatchHandler, Path]]] = None
+        self._workers: List[asyncio.Task] = []
+
+    async def _worker(self):
+        """Drain detected files from the queue, one at a time."""
+        while True:
+            handler, file_path = await self._queue.get()
+            try:
+                await handler.handle_new_file(file_path)
+            except Exception as e:
+                logger.error(f"Error handling new file {file_path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def start(
+        self,
+        callback: Callable[[Path], Optional[Awaitable[None]]],
+        watch_dirs: List[Path],
+        patterns: Optional[List[str]] = None,
+    ):
         """Start watching directories for new files.
         
         Args:
@@ -84,7 +157,11 @@ class WatchService:
             return
         
         self.running = True
-        
+
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self._max_queued_files)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._worker_count)]
+
         # Start the observer in a separate thread
         def start_observer():
             for watch_dir in watch_dirs:
@@ -92,7 +169,7 @@ class WatchService:
                     logger.warning(f"Watch directory does not exist: {watch_dir}")
                     continue
                 
-                handler = WatchHandler(callback, patterns)
+                handler = WatchHandler(callback, patterns, queue=self._queue, loop=loop)
                 self.handlers[watch_dir] = handler
                 self.observer.schedule(handler, str(watch_dir), recursive=True)
                 logger.info(f"Watching directory: {watch_dir}")
@@ -100,7 +177,6 @@ class WatchService:
             self.observer.start()
         
         # Run the observer in a separate thread
-        loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, start_observer)
         logger.info("Watch service started")
     
@@ -118,7 +194,13 @@ class WatchService:
         
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, stop_observer)
-        
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
         self.handlers.clear()
         logger.info("Watch service stopped")
     
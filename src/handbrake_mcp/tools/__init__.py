@@ -20,6 +20,8 @@ from .handbrake_tools import (
     transcode_video,
     batch_transcode,
     get_job_status,
+    get_job_statuses,
+    wait_for_job,
     cancel_job,
     get_presets,
     get_loaded_models,
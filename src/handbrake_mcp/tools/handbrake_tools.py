@@ -4,23 +4,59 @@ This module contains all the core HandBrake video processing tools:
 - transcode_video: Single file transcoding with professional settings
 - batch_transcode: Parallel batch processing of multiple files
 - get_job_status: Real-time job monitoring and progress tracking
+- get_job_statuses: Bulk job monitoring in a single call
 - cancel_job: Job termination and resource cleanup
 - get_presets: Dynamic preset discovery from HandBrake CLI
 - get_loaded_models: MCP compatibility endpoint for model discovery
 - get_provider_status: Comprehensive system health and capability reporting
 """
 
+import asyncio
 import logging
+import platform
+import tomllib
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import os
+from typing import Any, Dict, List, Optional
 
-from handbrake_mcp.services.handbrake import get_handbrake_service
+from handbrake_mcp.services.handbrake import (
+    _TERMINAL_STATUSES,
+    TranscodeJob,
+    failed_entry_id,
+    get_handbrake_service,
+)
 from handbrake_mcp.core.config import settings
 from handbrake_mcp.tools.utility_tools import TranscodeResponse, JobStatusResponse
 
 logger = logging.getLogger(__name__)
 
+
+def _read_server_version() -> str:
+    """Read the server version from the project's pyproject.toml."""
+    try:
+        pyproject_path = Path(__file__).resolve().parents[3] / "pyproject.toml"
+        if pyproject_path.exists():
+            with open(pyproject_path, "rb") as f:
+                data = tomllib.load(f)
+                return data.get("project", {}).get("version", "unknown")
+    except Exception as e:
+        logger.warning(f"Could not read version from pyproject.toml: {e}")
+    return "unknown"
+
+
+# Constant for the life of the process, so resolved once at import
+_SERVER_VERSION = _read_server_version()
+_SYSTEM_INFO = f"{platform.system()} {platform.machine()} {platform.release()}"
+
+# Longest a single wait_for_job call blocks by default, so one tool call never
+# holds the client for a whole encode
+_DEFAULT_WAIT_TIMEOUT = 30.0
+
+# get_job_status responses for finished jobs, so monitoring loops that keep
+# polling a finished job get the same object back. Bounded: the oldest entries
+# are dropped first, and an evicted job is simply rebuilt on its next poll.
+_terminal_status_cache: Dict[str, JobStatusResponse] = {}
+_TERMINAL_STATUS_CACHE_SIZE = 1024
+
 # Import MCP instance for decorator registration
 # This will be set by the registration system
 _mcp_instance = None
@@ -293,31 +329,27 @@ async def batch_transcode(
         - get_provider_status: For checking system capacity
         - get_presets: For discovering available presets
     """
-    results = []
-    for job in jobs:
-        try:
-            job_id = await get_handbrake_service().transcode(
-                input_path=job["input_path"],
-                output_path=job["output_path"],
-                preset=job.get("preset", default_preset or settings.default_preset),
-                options=job.get("options", {}),
-            )
-            results.append(TranscodeResponse(
-                job_id=job_id,
-                status="queued",
-                input_path=job["input_path"],
-                output_path=job["output_path"],
-            ))
-        except Exception as e:
-            results.append(TranscodeResponse(
-                job_id=f"error_{len(results)}",
-                status="failed",
-                input_path=job.get("input_path", ""),
-                output_path=job.get("output_path", ""),
-                error=str(e),
-            ))
-
-    return results
+    fallback_preset = default_preset or settings.default_preset
+    outcomes = await get_handbrake_service().transcode_many([
+        {**job, "preset": job.get("preset", fallback_preset)} for job in jobs
+    ])
+    return [
+        TranscodeResponse(
+            job_id=failed_entry_id(),
+            status="failed",
+            input_path=job.get("input_path", ""),
+            output_path=job.get("output_path", ""),
+            error=str(outcome),
+        )
+        if isinstance(outcome, Exception)
+        else TranscodeResponse(
+            job_id=outcome,
+            status="queued",
+            input_path=job["input_path"],
+            output_path=job["output_path"],
+        )
+        for job, outcome in zip(jobs, outcomes, strict=True)
+    ]
 
 
 @tool(
@@ -382,17 +414,13 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
                 print(f"Job {status.status}: {status.progress:.1f}% complete")
             # Returns: {'job_id': 'job_12345', 'status': 'processing', 'progress': 45.2, 'input_path': '/input.mp4', 'output_path': '/output.mkv'}
 
-        Progress monitoring loop:
-            import asyncio
+        Waiting for completion (no sleep interval needed):
             job_id = "batch_001_005"
-
-            while True:
-                status = await get_job_status(job_id)
-                if status.status in ["completed", "failed", "cancelled"]:
-                    print(f"Job finished with status: {status.status}")
-                    break
+            status = await wait_for_job(job_id)
+            while status.status in ("queued", "processing"):
                 print(f"Progress: {status.progress:.1f}%")
-                await asyncio.sleep(10)  # Check every 10 seconds
+                status = await wait_for_job(job_id)
+            print(f"Job finished with status: {status.status}")
 
         Error handling for invalid job:
             status = await get_job_status("nonexistent_job")
@@ -418,15 +446,118 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
         - Cancelled jobs show final status before termination
         - Job information persists for a limited time after completion
         - Use this tool to build progress bars and monitoring dashboards
-        - Status polling is lightweight and can be done frequently
+        - Status polling is lightweight; to wait for a job to finish, use wait_for_job
 
     See Also:
+        - wait_for_job: For waiting until a job finishes
         - transcode_video: For starting transcoding jobs
         - batch_transcode: For starting multiple jobs
         - cancel_job: For stopping running jobs
         - get_provider_status: For system-wide status information
     """
-    job = await get_handbrake_service().get_job_status(job_id)
+    cached = _terminal_status_cache.get(job_id)
+    if cached is not None:
+        return cached
+    return _job_status_response(job_id, await get_handbrake_service().get_job_status(job_id))
+
+
+@tool(
+    name="get_job_statuses",
+    description="Get status and progress for many transcode jobs in a single call",
+    tags={"status", "monitoring", "jobs", "progress", "tracking", "batch", "handbrake"}
+)
+async def get_job_statuses(job_ids: List[str]) -> List[JobStatusResponse]:
+    """
+    Get status and progress for many transcode jobs in a single call.
+
+    The bulk form of get_job_status and the preferred way to monitor batches: one tool
+    call per polling tick returns every job's status, instead of one call per job.
+
+    Parameters:
+        job_ids: Identifiers of the transcode jobs to check
+            - Job IDs as returned by transcode_video and batch_transcode
+            - Unknown IDs produce a 'not_found' entry rather than an error
+            - Duplicates are allowed and answered individually
+
+    Returns:
+        List of JobStatusResponse objects in the same order as job_ids, each with the
+        same fields get_job_status returns
+
+    Examples:
+        Monitor a whole batch:
+            results = await batch_transcode(jobs)
+            statuses = await get_job_statuses([r.job_id for r in results])
+            done = sum(s.status in ("completed", "failed", "cancelled") for s in statuses)
+            print(f"{done}/{len(statuses)} jobs finished")
+
+    Notes:
+        - Finished jobs are answered from the same cache get_job_status uses
+        - Order of the results always matches the order of job_ids
+
+    See Also:
+        - get_job_status: For a single job
+        - batch_transcode: For starting the jobs this tool monitors
+        - cancel_job: For stopping running jobs
+    """
+    responses: List[Optional[JobStatusResponse]] = [
+        _terminal_status_cache.get(job_id) for job_id in job_ids
+    ]
+    missing = [i for i, response in enumerate(responses) if response is None]
+    if missing:
+        jobs = await get_handbrake_service().get_job_statuses([job_ids[i] for i in missing])
+        for i, job in zip(missing, jobs, strict=True):
+            responses[i] = _job_status_response(job_ids[i], job)
+    return responses
+
+
+@tool(
+    name="wait_for_job",
+    description="Wait until a transcode job finishes and return its final status",
+    tags={"status", "monitoring", "jobs", "wait", "tracking", "handbrake"}
+)
+async def wait_for_job(job_id: str, timeout: float = _DEFAULT_WAIT_TIMEOUT) -> JobStatusResponse:
+    """
+    Wait until a transcode job finishes and return its final status.
+
+    The push-based alternative to polling get_job_status: the call returns as soon as
+    the job reaches 'completed', 'failed' or 'cancelled', with no sleep interval to tune.
+
+    Parameters:
+        job_id: Unique identifier of the transcode job to wait for
+            - As returned by transcode_video or batch_transcode
+        timeout: Maximum number of seconds to wait (default: 30)
+            - On timeout the job's current, still-running status is returned
+            - Keep it below the client's request timeout; call again to keep waiting
+
+    Returns:
+        JobStatusResponse with the same fields get_job_status returns; the status is
+        terminal unless the timeout expired first, or 'not_found' for unknown job IDs
+
+    Examples:
+        Wait for a short job:
+            job_id = await transcode_video("/videos/input.mp4", "/videos/output.mp4")
+            status = await wait_for_job(job_id)
+            print(f"Job status: {status.status}")
+
+        Wait for a long job, reporting progress between waits:
+            status = await wait_for_job(job_id, timeout=60)
+            while status.status in ("queued", "processing"):
+                print(f"Progress: {status.progress:.1f}%")
+                status = await wait_for_job(job_id, timeout=60)
+
+    See Also:
+        - get_job_status: For a non-blocking status check
+        - get_job_statuses: For checking many jobs at once
+        - cancel_job: For stopping running jobs
+    """
+    cached = _terminal_status_cache.get(job_id)
+    if cached is not None:
+        return cached
+    return _job_status_response(job_id, await get_handbrake_service().wait_for_job(job_id, timeout))
+
+
+def _job_status_response(job_id: str, job: Optional[TranscodeJob]) -> JobStatusResponse:
+    """Build the status response for a job, caching it once the job has finished."""
     if not job:
         return JobStatusResponse(
             job_id=job_id,
@@ -437,14 +568,19 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
             output_path="",
         )
 
-    return JobStatusResponse(
+    response = JobStatusResponse(
         job_id=job.job_id,
         status=job.status,
         progress=job.progress,
         error=job.error,
-        input_path=str(job.input_path),
-        output_path=str(job.output_path),
+        input_path=job.input_path_str,
+        output_path=job.output_path_str,
     )
+    if job.status in _TERMINAL_STATUSES:
+        if len(_terminal_status_cache) >= _TERMINAL_STATUS_CACHE_SIZE:
+            del _terminal_status_cache[next(iter(_terminal_status_cache))]
+        _terminal_status_cache[job_id] = response
+    return response
 
 
 @tool(
@@ -545,7 +681,9 @@ async def cancel_job(job_id: str) -> bool:
         - get_job_status: For checking job status before/after cancellation
         - get_provider_status: For checking active job counts
     """
-    return await get_handbrake_service().cancel_job(job_id)
+    cancelled = await get_handbrake_service().cancel_job(job_id)
+    _terminal_status_cache.pop(job_id, None)
+    return cancelled
 
 
 @tool(
@@ -778,7 +916,7 @@ async def get_loaded_models() -> List[str]:
         - batch_transcode: For applying models to multiple files
         - get_provider_status: For checking HandBrake CLI version and status
     """
-    return await get_handbrake_service().get_presets()
+    return await get_presets()
 
 
 @tool(
@@ -935,31 +1073,18 @@ async def get_provider_status() -> Dict[str, str]:
         handbrake_service = get_handbrake_service()
 
         # Get dynamic information
-        handbrake_version = await handbrake_service.get_handbrake_version()
-        supported_presets = await handbrake_service.get_presets()
-        active_jobs = len([job for job in handbrake_service.jobs.values() if job.status == "processing"])
-
-        # Get server version from pyproject.toml
-        server_version = "unknown"
-        try:
-            pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-            if pyproject_path.exists():
-                import tomllib
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-                    server_version = data.get("project", {}).get("version", "unknown")
-        except Exception as e:
-            logger.warning(f"Could not read version from pyproject.toml: {e}")
-
-        # Get system information
-        system_info = f"{os.name} {os.sys.platform}"
+        handbrake_version, supported_presets = await asyncio.gather(
+            handbrake_service.get_handbrake_version(),
+            handbrake_service.get_presets(),
+        )
+        active_jobs = handbrake_service.active_jobs
 
         return {
             "status": "ready",
-            "version": server_version,
+            "version": _SERVER_VERSION,
             "handbrake_version": handbrake_version,
             "supported_presets": supported_presets,
-            "system_info": system_info,
+            "system_info": _SYSTEM_INFO,
             "max_concurrent_jobs": handbrake_service._max_concurrent_jobs,
             "active_jobs": active_jobs,
         }
@@ -9,9 +9,185 @@ This module contains all help, documentation, and tool discovery tools:
 - search_tools: Keyword-based tool discovery
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+
+from .utility_tools import ToolDocumentation, get_all_tool_documentation, icon
+
+# Static help text, built once at import
+_ADVANCED_OVERVIEW = "\n".join((
+    "[ADVANCED] HANDBRAKE MCP - ADVANCED OVERVIEW",
+    "=" * 50,
+    "\n[INFO] SYSTEM CAPABILITIES: {tool_count} specialized tools",
+    "",
+    "[TOOLS] CORE WORKFLOW:",
+    "  1. transcode_video - Single file processing",
+    "  2. batch_transcode - Multiple file processing",
+    "  3. get_job_status - Progress monitoring",
+    "  4. cancel_job - Job management",
+    "  5. get_presets - Configuration discovery",
+    "",
+    "[TROUBLESHOOT] ADVANCED FEATURES:",
+    "  - Real-time progress tracking",
+    "  - Hardware acceleration support",
+    "  - Batch processing optimization",
+    "  - Error handling and recovery",
+    "  - Resource management",
+    "",
+))
+
+_ADVANCED_EXAMPLES = "\n".join((
+    "[TIP] HANDBRAKE MCP - USAGE EXAMPLES",
+    "=" * 50,
+    "\n[USAGE] BASIC USAGE:",
+    "  # Single video transcoding",
+    "  transcode_video('/videos/input.mp4', '/videos/output.mkv')",
+    "",
+    "  # Batch processing",
+    "  batch_transcode([{'input_path': 'file1.mp4', 'output_path': 'file1.mkv'}])",
+    "",
+    "  # With custom presets",
+    "  transcode_video('/videos/input.mp4', '/videos/output.mp4', preset='HQ 1080p30')",
+    "",
+    "[INFO] MONITORING:",
+    "  # Check job status",
+    "  get_job_status('job_12345')",
+    "",
+    "  # Get system status",
+    "  get_provider_status()",
+    "",
+    "[CONFIG]  CONFIGURATION:",
+    "  # Discover available presets",
+    "  presets = get_presets()",
+    "",
+    "  # Check system capabilities",
+    "  status = get_provider_status()",
+    "  print(f'Available presets: {len(status[\"supported_presets\"])}')",
+))
+
+_ADVANCED_TROUBLESHOOTING = "\n".join((
+    "[TROUBLESHOOT] HANDBRAKE MCP - TROUBLESHOOTING GUIDE",
+    "=" * 50,
+    f"\n{icon('error')}COMMON ISSUES:",
+    "",
+    f"{icon('search')}'HandBrake CLI not found':",
+    "  - Install HandBrake CLI or set HBB_PATH",
+    "  - Verify installation with 'HandBrakeCLI --version'",
+    "  - Check system PATH environment variable",
+    "",
+    f"{icon('file')}'File not found':",
+    "  - Verify input file path exists",
+    "  - Check file permissions",
+    "  - Use absolute paths when possible",
+    "",
+    "[CONFIG]  'Invalid preset':",
+    "  - Use get_presets() to see available options",
+    "  - Check HandBrake CLI version compatibility",
+    "  - Verify preset name spelling",
+    "",
+    f"{icon('stop')}'Job failed':",
+    "  - Check error message in job status",
+    "  - Verify output directory exists and is writable",
+    "  - Check available disk space",
+    "  - Review system resource usage",
+    "",
+    f"{icon('search')}DIAGNOSTIC STEPS:",
+    "  1. Run get_provider_status() to check system health",
+    "  2. Use get_presets() to verify available options",
+    "  3. Check job status with get_job_status()",
+    "  4. Review system logs for error details",
+    "  5. Test with simple files first",
+))
+
+_ADVANCED_PERFORMANCE = "\n".join((
+    "[PERFORMANCE] HANDBRAKE MCP - PERFORMANCE OPTIMIZATION",
+    "=" * 50,
+    "\n[TOOLS] OPTIMIZATION STRATEGIES:",
+    "",
+    f"{icon('resources')}RESOURCE MANAGEMENT:",
+    "  - Use appropriate presets for your use case",
+    "  - Monitor system resources during processing",
+    "  - Adjust max_concurrent_jobs based on system capacity",
+    "  - Use hardware acceleration when available",
+    "",
+    "[BATCH] BATCH PROCESSING:",
+    "  - Process similar files together for efficiency",
+    "  - Use consistent presets within batches",
+    "  - Monitor memory usage with large batches",
+    "  - Consider disk I/O limitations",
+    "",
+    "[TROUBLESHOOT] SYSTEM TUNING:",
+    "  - Ensure adequate RAM for video processing",
+    "  - Use SSD storage for temporary files",
+    "  - Monitor CPU and GPU utilization",
+    "  - Consider network storage limitations",
+    "",
+    "[INFO] MONITORING TOOLS:",
+    "  - get_provider_status() - System health",
+    "  - get_job_status() - Individual job progress",
+    "  - Use detailed help for tool-specific guidance",
+))
+
+_ADVANCED_HELP: Dict[str, str] = {
+    "examples": _ADVANCED_EXAMPLES,
+    "troubleshooting": _ADVANCED_TROUBLESHOOTING,
+    "performance": _ADVANCED_PERFORMANCE,
+}
+
+_BASIC_HELP_QUICK_COMMANDS = "\n".join((
+    "[TIP] QUICK COMMANDS:",
+    "  - help - Get comprehensive help for tools",
+    "  - system_status - Get comprehensive system status",
+    "  - get_presets - List all available HandBrake presets",
+    "  - transcode_video - Transcode a single video file",
+    "",
+    f"{icon('search')}For detailed help on any tool, use: help('tool_name', 'detailed')",
+))
+
+_DETAILED_HELP_LEGEND = "\n".join((
+    "[DOCS] LEGEND:",
+    "  [RUNNING] Ready for use",
+    f"  {icon('pending')}Requires configuration",
+    f"  {icon('warning')}May require additional setup",
+))
+
+# Indexes derived from the docs registry, rebuilt only when the registry changes:
+# category -> tool names, and tool name -> lowercase search text. The indexed
+# registry is held (not just its id) so a new dict can never pass for it.
+_category_index: Dict[str, List[str]] = {}
+_search_index: Dict[str, str] = {}
+_indexed_docs: Optional[Dict[str, ToolDocumentation]] = None
+_indexed_generation = -1
+
+
+def _refresh_indexes() -> None:
+    """Rebuild the category and search indexes if the docs registry has changed."""
+    global _category_index, _search_index, _indexed_docs, _indexed_generation
+    docs = get_all_tool_documentation()
+    generation = getattr(docs, "generation", 0)
+    if docs is _indexed_docs and generation == _indexed_generation:
+        return
+
+    categories: Dict[str, List[str]] = {}
+    search: Dict[str, str] = {}
+    for tool_name, doc in docs.items():
+        for category in doc.categories:
+            categories.setdefault(category, []).append(tool_name)
+        # NUL separators keep a query from matching across field boundaries
+        search[tool_name] = "\x00".join(
+            (tool_name, doc.summary, doc.description, *doc.categories)
+        ).lower()
+
+    _category_index = categories
+    _search_index = search
+    _indexed_docs = docs
+    _indexed_generation = generation
+
+
+def _get_category_index() -> Dict[str, List[str]]:
+    """Return the category index for the current docs registry."""
+    _refresh_indexes()
+    return _category_index
 
-from .utility_tools import get_all_tool_documentation
 
 # Import MCP instance for decorator registration
 # This will be set by the registration system
@@ -49,6 +225,24 @@ def register_pending_tools():
         globals()[func.__name__] = decorated_func
 
 
+def _render_tool_help_basic(doc: ToolDocumentation) -> str:
+    return f"[TOOL] {doc.name}: {doc.get_basic_description()}"
+
+
+def _render_tool_help_detailed(doc: ToolDocumentation) -> str:
+    return (
+        f"[DETAIL] {doc.name.upper()}\n\n{doc.get_detailed_description()}\n\n"
+        f"PARAMETERS: {len(doc.parameters)} | EXAMPLES: {len(doc.examples)}"
+    )
+
+
+_TOOL_HELP_RENDERERS: Dict[str, Callable[[ToolDocumentation], str]] = {
+    "basic": _render_tool_help_basic,
+    "detailed": _render_tool_help_detailed,
+    "full": ToolDocumentation.get_multiline_description,
+}
+
+
 @tool(
     name="help",
     description="Get comprehensive help for tools at different detail levels",
@@ -124,18 +318,12 @@ def get_tool_help(tool_name: str, level: str = "basic") -> str:
     docs = get_all_tool_documentation()
 
     if tool_name not in docs:
-        return f"❌ Tool '{tool_name}' not found. Available tools: {', '.join(docs.keys())}"
-
-    doc = docs[tool_name]
+        return f"{icon('error')}Tool '{tool_name}' not found. Available tools: {', '.join(docs.keys())}"
 
-    if level == "basic":
-        return f"[TOOL] {doc.name}: {doc.get_basic_description()}"
-    elif level == "detailed":
-        return f"[DETAIL] {doc.name.upper()}\n\n{doc.get_detailed_description()}\n\nPARAMETERS: {len(doc.parameters)} | EXAMPLES: {len(doc.examples)}"
-    elif level == "full":
-        return doc.get_multiline_description()
-    else:
-        return f"❌ Invalid help level '{level}'. Use: basic, detailed, or full"
+    render = _TOOL_HELP_RENDERERS.get(level)
+    if render is None:
+        return f"{icon('error')}Invalid help level '{level}'. Use: basic, detailed, or full"
+    return render(docs[tool_name])
 
 
 @tool(
@@ -205,16 +393,8 @@ def get_tool_categories() -> Dict[str, List[str]]:
         - get_multilevel_help: For category-based help display
         - search_tools: For keyword-based tool discovery
     """
-    docs = get_all_tool_documentation()
-
-    categories = {}
-    for tool_name, doc in docs.items():
-        for category in doc.categories:
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(tool_name)
-
-    return categories
+    # Copies, so callers can't mutate the shared index
+    return {category: list(tools) for category, tools in _get_category_index().items()}
 
 
 def get_tools_by_category(category: str) -> List[str]:
@@ -284,8 +464,7 @@ def get_tools_by_category(category: str) -> List[str]:
         - search_tools: For keyword-based tool discovery
         - get_multilevel_help: For category-filtered help display
     """
-    docs = get_all_tool_documentation()
-    return [name for name, doc in docs.items() if category in doc.categories]
+    return list(_get_category_index().get(category, ()))
 
 
 @tool(
@@ -369,18 +548,94 @@ def search_tools(query: str) -> List[str]:
         - get_multilevel_help: For categorized help display
         - get_tool_help: For detailed information about specific tools
     """
-    docs = get_all_tool_documentation()
+    _refresh_indexes()
     query_lower = query.lower()
+    return [tool_name for tool_name, text in _search_index.items() if query_lower in text]
+
+
+def _render_basic_help(docs: Dict[str, ToolDocumentation], filter_by: Optional[str]) -> str:
+    lines = ["[TOOLS]  HANDBRAKE MCP TOOLS - BASIC HELP"]
+    lines.append("=" * 50)
+
+    lines.append(f"\n[INFO] OVERVIEW: {len(docs)} tools available")
+    lines.append("")
+
+    lines.append("[TOOLS] AVAILABLE TOOLS:")
+    lines.extend(f"  - {tool_name}: {doc.get_basic_description()}" for tool_name, doc in docs.items())
+
+    lines.append("")
+    lines.append(_BASIC_HELP_QUICK_COMMANDS)
+    return "\n".join(lines)
+
+
+def _detailed_tool_entry(tool_name: str, doc: ToolDocumentation) -> str:
+    return (
+        f"  - {tool_name}: {doc.get_detailed_description()}\n"
+        f"    Parameters: {len(doc.parameters)} | Examples: {len(doc.examples)}"
+    )
 
-    results = []
-    for tool_name, doc in docs.items():
-        if (query_lower in tool_name.lower() or
-            query_lower in doc.summary.lower() or
-            query_lower in doc.description.lower() or
-            any(query_lower in category.lower() for category in doc.categories)):
-            results.append(tool_name)
 
-    return results
+def _render_detailed_help(docs: Dict[str, ToolDocumentation], filter_by: Optional[str]) -> str:
+    lines = [f"{icon('search')}HANDBRAKE MCP TOOLS - DETAILED HELP"]
+    lines.append("=" * 50)
+
+    # Group by category
+    categories = get_tool_categories()
+
+    for category, tools in categories.items():
+        if filter_by and filter_by.lower() not in category.lower():
+            continue
+
+        lines.append(f"\n{icon('category')}{category.upper()}:")
+        lines.extend(_detailed_tool_entry(tool_name, docs[tool_name]) for tool_name in tools)
+
+    lines.append("")
+    lines.append(_DETAILED_HELP_LEGEND)
+    return "\n".join(lines)
+
+
+def _render_full_help(docs: Dict[str, ToolDocumentation], filter_by: Optional[str]) -> str:
+    if filter_by:
+        # Show full help for specific tool
+        if filter_by in docs:
+            return docs[filter_by].get_multiline_description()
+        return f"{icon('error')}Tool '{filter_by}' not found. Use 'help' to see available tools."
+
+    # Show full help for all tools
+    lines = ["[DOCS] HANDBRAKE MCP TOOLS - COMPLETE DOCUMENTATION"]
+    lines.append("=" * 60)
+
+    for i, (tool_name, doc) in enumerate(docs.items(), 1):
+        lines.append(f"\n{i}. {doc.get_multiline_description()}")
+        if i < len(docs):
+            lines.append("\n" + "-" * 60)
+    return "\n".join(lines)
+
+
+def _render_categories_help(docs: Dict[str, ToolDocumentation], filter_by: Optional[str]) -> str:
+    lines = [f"{icon('category')}HANDBRAKE MCP TOOLS - CATEGORIES"]
+    lines.append("=" * 50)
+
+    categories = get_tool_categories()
+
+    lines.append(f"\n[INFO] CATEGORY OVERVIEW: {len(categories)} categories")
+    lines.append("")
+
+    for category, tools in categories.items():
+        lines.append(f"{icon('file')}{category.upper()} ({len(tools)} tools):")
+        lines.extend(f"  - {tool_name}: {docs[tool_name].get_basic_description()}" for tool_name in tools)
+        lines.append("")
+    return "\n".join(lines)
+
+
+_MULTILEVEL_HELP_RENDERERS: Dict[
+    str, Callable[[Dict[str, ToolDocumentation], Optional[str]], str]
+] = {
+    "basic": _render_basic_help,
+    "detailed": _render_detailed_help,
+    "full": _render_full_help,
+    "categories": _render_categories_help,
+}
 
 
 @tool(
@@ -464,88 +719,10 @@ def get_multilevel_help(level: str = "basic", filter_by: Optional[str] = None) -
         - search_tools: For keyword-based tool discovery
         - system_status: For current system state and configuration
     """
-    docs = get_all_tool_documentation()
-
-    if level == "basic":
-        lines = ["[TOOLS]  HANDBRAKE MCP TOOLS - BASIC HELP"]
-        lines.append("=" * 50)
-
-        lines.append(f"\n[INFO] OVERVIEW: {len(docs)} tools available")
-        lines.append("")
-
-        lines.append("[TOOLS] AVAILABLE TOOLS:")
-        for tool_name, doc in docs.items():
-            lines.append(f"  - {tool_name}: {doc.get_basic_description()}")
-
-        lines.append("")
-        lines.append("[TIP] QUICK COMMANDS:")
-        lines.append("  - help - Get comprehensive help for tools")
-        lines.append("  - system_status - Get comprehensive system status")
-        lines.append("  - get_presets - List all available HandBrake presets")
-        lines.append("  - transcode_video - Transcode a single video file")
-        lines.append("")
-        lines.append("🔍 For detailed help on any tool, use: help('tool_name', 'detailed')")
-
-    elif level == "detailed":
-        lines = ["🔍 HANDBRAKE MCP TOOLS - DETAILED HELP"]
-        lines.append("=" * 50)
-
-        # Group by category
-        categories = get_tool_categories()
-
-        for category, tools in categories.items():
-            if filter_by and filter_by.lower() not in category.lower():
-                continue
-
-            lines.append(f"\n📂 {category.upper()}:")
-            for tool_name in tools:
-                doc = docs[tool_name]
-                lines.append(f"  - {tool_name}: {doc.get_detailed_description()}")
-                lines.append(f"    Parameters: {len(doc.parameters)} | Examples: {len(doc.examples)}")
-
-        lines.append("")
-        lines.append("[DOCS] LEGEND:")
-        lines.append("  [RUNNING] Ready for use")
-        lines.append("  🟡 Requires configuration")
-        lines.append("  🔴 May require additional setup")
-
-    elif level == "full":
-        if filter_by:
-            # Show full help for specific tool
-            if filter_by in docs:
-                return docs[filter_by].get_multiline_description()
-            else:
-                return f"❌ Tool '{filter_by}' not found. Use 'help' to see available tools."
-        else:
-            # Show full help for all tools
-            lines = ["[DOCS] HANDBRAKE MCP TOOLS - COMPLETE DOCUMENTATION"]
-            lines.append("=" * 60)
-
-            for i, (tool_name, doc) in enumerate(docs.items(), 1):
-                lines.append(f"\n{i}. {doc.get_multiline_description()}")
-                if i < len(docs):
-                    lines.append("\n" + "-" * 60)
-
-    elif level == "categories":
-        lines = ["📂 HANDBRAKE MCP TOOLS - CATEGORIES"]
-        lines.append("=" * 50)
-
-        categories = get_tool_categories()
-
-        lines.append(f"\n[INFO] CATEGORY OVERVIEW: {len(categories)} categories")
-        lines.append("")
-
-        for category, tools in categories.items():
-            lines.append(f"📁 {category.upper()} ({len(tools)} tools):")
-            for tool_name in tools:
-                doc = docs[tool_name]
-                lines.append(f"  - {tool_name}: {doc.get_basic_description()}")
-            lines.append("")
-
-    else:
-        return f"❌ Invalid help level '{level}'. Available levels: basic, detailed, full, categories"
-
-    return "\n".join(lines)
+    render = _MULTILEVEL_HELP_RENDERERS.get(level)
+    if render is None:
+        return f"{icon('error')}Invalid help level '{level}'. Available levels: basic, detailed, full, categories"
+    return render(get_all_tool_documentation(), filter_by)
 
 
 @tool(
@@ -628,139 +805,10 @@ def get_advanced_help(tool_name: Optional[str] = None, help_type: str = "overvie
         - system_status: For current system state and monitoring
         - get_provider_status: For detailed system health information
     """
-    docs = get_all_tool_documentation()
-
     if help_type == "overview":
-        lines = ["[ADVANCED] HANDBRAKE MCP - ADVANCED OVERVIEW"]
-        lines.append("=" * 50)
-
-        lines.append(f"\n[INFO] SYSTEM CAPABILITIES: {len(docs)} specialized tools")
-        lines.append("")
-
-        lines.append("[TOOLS] CORE WORKFLOW:")
-        lines.append("  1. transcode_video - Single file processing")
-        lines.append("  2. batch_transcode - Multiple file processing")
-        lines.append("  3. get_job_status - Progress monitoring")
-        lines.append("  4. cancel_job - Job management")
-        lines.append("  5. get_presets - Configuration discovery")
-        lines.append("")
-
-        lines.append("[TROUBLESHOOT] ADVANCED FEATURES:")
-        lines.append("  - Real-time progress tracking")
-        lines.append("  - Hardware acceleration support")
-        lines.append("  - Batch processing optimization")
-        lines.append("  - Error handling and recovery")
-        lines.append("  - Resource management")
-        lines.append("")
-
-    elif help_type == "examples":
-        lines = ["[TIP] HANDBRAKE MCP - USAGE EXAMPLES"]
-        lines.append("=" * 50)
-
-        lines.append("\n[USAGE] BASIC USAGE:")
-        lines.append("  # Single video transcoding")
-        lines.append("  transcode_video('/videos/input.mp4', '/videos/output.mkv')")
-        lines.append("")
-
-        lines.append("  # Batch processing")
-        lines.append("  batch_transcode([{'input_path': 'file1.mp4', 'output_path': 'file1.mkv'}])")
-        lines.append("")
-
-        lines.append("  # With custom presets")
-        lines.append("  transcode_video('/videos/input.mp4', '/videos/output.mp4', preset='HQ 1080p30')")
-        lines.append("")
-
-        lines.append("[INFO] MONITORING:")
-        lines.append("  # Check job status")
-        lines.append("  get_job_status('job_12345')")
-        lines.append("")
+        return _ADVANCED_OVERVIEW.format(tool_count=len(get_all_tool_documentation()))
 
-        lines.append("  # Get system status")
-        lines.append("  get_provider_status()")
-        lines.append("")
-
-        lines.append("[CONFIG]  CONFIGURATION:")
-        lines.append("  # Discover available presets")
-        lines.append("  presets = get_presets()")
-        lines.append("")
-
-        lines.append("  # Check system capabilities")
-        lines.append("  status = get_provider_status()")
-        lines.append("  print(f'Available presets: {len(status[\"supported_presets\"])}')")
-
-    elif help_type == "troubleshooting":
-        lines = ["[TROUBLESHOOT] HANDBRAKE MCP - TROUBLESHOOTING GUIDE"]
-        lines.append("=" * 50)
-
-        lines.append("\n❌ COMMON ISSUES:")
-        lines.append("")
-
-        lines.append("🔍 'HandBrake CLI not found':")
-        lines.append("  - Install HandBrake CLI or set HBB_PATH")
-        lines.append("  - Verify installation with 'HandBrakeCLI --version'")
-        lines.append("  - Check system PATH environment variable")
-        lines.append("")
-
-        lines.append("📁 'File not found':")
-        lines.append("  - Verify input file path exists")
-        lines.append("  - Check file permissions")
-        lines.append("  - Use absolute paths when possible")
-        lines.append("")
-
-        lines.append("[CONFIG]  'Invalid preset':")
-        lines.append("  - Use get_presets() to see available options")
-        lines.append("  - Check HandBrake CLI version compatibility")
-        lines.append("  - Verify preset name spelling")
-        lines.append("")
-
-        lines.append("🛑 'Job failed':")
-        lines.append("  - Check error message in job status")
-        lines.append("  - Verify output directory exists and is writable")
-        lines.append("  - Check available disk space")
-        lines.append("  - Review system resource usage")
-        lines.append("")
-
-        lines.append("🔍 DIAGNOSTIC STEPS:")
-        lines.append("  1. Run get_provider_status() to check system health")
-        lines.append("  2. Use get_presets() to verify available options")
-        lines.append("  3. Check job status with get_job_status()")
-        lines.append("  4. Review system logs for error details")
-        lines.append("  5. Test with simple files first")
-
-    elif help_type == "performance":
-        lines = ["[PERFORMANCE] HANDBRAKE MCP - PERFORMANCE OPTIMIZATION"]
-        lines.append("=" * 50)
-
-        lines.append("\n[TOOLS] OPTIMIZATION STRATEGIES:")
-        lines.append("")
-
-        lines.append("💾 RESOURCE MANAGEMENT:")
-        lines.append("  - Use appropriate presets for your use case")
-        lines.append("  - Monitor system resources during processing")
-        lines.append("  - Adjust max_concurrent_jobs based on system capacity")
-        lines.append("  - Use hardware acceleration when available")
-        lines.append("")
-
-        lines.append("[BATCH] BATCH PROCESSING:")
-        lines.append("  - Process similar files together for efficiency")
-        lines.append("  - Use consistent presets within batches")
-        lines.append("  - Monitor memory usage with large batches")
-        lines.append("  - Consider disk I/O limitations")
-        lines.append("")
-
-        lines.append("[TROUBLESHOOT] SYSTEM TUNING:")
-        lines.append("  - Ensure adequate RAM for video processing")
-        lines.append("  - Use SSD storage for temporary files")
-        lines.append("  - Monitor CPU and GPU utilization")
-        lines.append("  - Consider network storage limitations")
-        lines.append("")
-
-        lines.append("[INFO] MONITORING TOOLS:")
-        lines.append("  - get_provider_status() - System health")
-        lines.append("  - get_job_status() - Individual job progress")
-        lines.append("  - Use detailed help for tool-specific guidance")
-
-    else:
-        return f"❌ Invalid help type '{help_type}'. Available types: overview, examples, troubleshooting, performance"
-
-    return "\n".join(lines)
+    help_text = _ADVANCED_HELP.get(help_type)
+    if help_text is None:
+        return f"{icon('error')}Invalid help type '{help_type}'. Available types: overview, examples, troubleshooting, performance"
+    return help_text
@@ -4,9 +4,43 @@ This module contains system status and monitoring tools:
 - get_system_status: Comprehensive system status with tools, configuration, and resources
 """
 
+import os
+import platform
+import sys
+import time
+from typing import Dict, Optional
+
+import psutil
+
 from handbrake_mcp.core.config import settings
 from .help_tools import get_tool_categories
-from .utility_tools import get_all_tool_documentation
+from .utility_tools import get_all_tool_documentation, icon
+
+# Interpreter and host details don't change while the server runs
+_PY_VERSION = sys.version
+_PLATFORM = platform.platform()
+
+# Root of the drive the server runs from ("C:" on Windows, "/" elsewhere)
+_DISK_ROOT = (os.path.splitdrive(os.getcwd())[0] + os.sep) if os.name == "nt" else "/"
+
+# Resource snapshot shared by rapid status polls
+_RESOURCE_TTL_SECONDS = 1.0
+_resource_snapshot: Optional[Dict[str, float]] = None
+_resource_snapshot_at = 0.0
+
+
+def _collect_resources() -> Dict[str, float]:
+    """Return CPU, memory and disk usage percentages, reusing a snapshot younger than the TTL."""
+    global _resource_snapshot, _resource_snapshot_at
+    now = time.monotonic()
+    if _resource_snapshot is None or now - _resource_snapshot_at >= _RESOURCE_TTL_SECONDS:
+        _resource_snapshot = {
+            "cpu": psutil.cpu_percent(interval=None),
+            "memory": psutil.virtual_memory().percent,
+            "disk": psutil.disk_usage(_DISK_ROOT).percent,
+        }
+        _resource_snapshot_at = now
+    return _resource_snapshot
 
 # Import MCP instance for decorator registration
 # This will be set by the registration system
@@ -139,22 +173,20 @@ def get_system_status() -> str:
     # Server information
     lines.append("\n[INFO] SERVER INFO:")
     lines.append("  - Status: [RUNNING] Running")
-    lines.append(f"  - Version: {__import__('sys').version}")
-    lines.append(f"  - Platform: {__import__('platform').platform()}")
+    lines.append(f"  - Version: {_PY_VERSION}")
+    lines.append(f"  - Platform: {_PLATFORM}")
     lines.append("")
 
     # Tool information
     docs = get_all_tool_documentation()
     lines.append(f"[TOOLS]  TOOLS: {len(docs)} registered")
-    for tool_name, doc in docs.items():
-        lines.append(f"  - {tool_name}: {doc.get_basic_description()}")
+    lines.extend(f"  - {tool_name}: {doc.get_basic_description()}" for tool_name, doc in docs.items())
     lines.append("")
 
     # Categories
     categories = get_tool_categories()
-    lines.append(f"📂 CATEGORIES: {len(categories)}")
-    for category, tools in categories.items():
-        lines.append(f"  - {category}: {len(tools)} tools")
+    lines.append(f"{icon('category')}CATEGORIES: {len(categories)}")
+    lines.extend(f"  - {category}: {len(tools)} tools" for category, tools in categories.items())
     lines.append("")
 
     # Configuration
@@ -165,11 +197,11 @@ def get_system_status() -> str:
     lines.append("")
 
     # Resources
-    lines.append("💾 RESOURCES:")
-    import psutil
-    lines.append(f"  - CPU Usage: {psutil.cpu_percent()}%")
-    lines.append(f"  - Memory Usage: {psutil.virtual_memory().percent}%")
-    lines.append(f"  - Disk Usage: {psutil.disk_usage('/').percent}%")
+    lines.append(f"{icon('resources')}RESOURCES:")
+    resources = _collect_resources()
+    lines.append(f"  - CPU Usage: {resources['cpu']}%")
+    lines.append(f"  - Memory Usage: {resources['memory']}%")
+    lines.append(f"  - Disk Usage: {resources['disk']}%")
     lines.append("")
 
     # Quick help
@@ -6,10 +6,10 @@ used by other tool modules in the HandBrake MCP server.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any, Type
+from typing import Annotated, Dict, List, Literal, Optional, Callable, Any, Type
 from functools import wraps
 from inspect import signature, Parameter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pydantic import BaseModel, Field
 
@@ -18,8 +18,37 @@ from handbrake_mcp.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Emoji used in help and status text, keyed by meaning
+_ICONS = {
+    "error": "❌",
+    "search": "🔍",
+    "file": "📁",
+    "stop": "🛑",
+    "resources": "💾",
+    "pending": "🟡",
+    "warning": "🔴",
+    "category": "📂",
+}
 
-@dataclass
+
+def icon(key: str) -> str:
+    """Return the emoji for key followed by a space, or "" when rich output is disabled."""
+    return f"{_ICONS[key]} " if settings.rich_output else ""
+
+
+# Optional per-parameter fields, in display order
+_PARAM_FIELDS = (("type", "Type"), ("default", "Default"), ("required", "Required"))
+
+
+def _format_param(name: str, info: Dict[str, Any]) -> str:
+    """Format one parameter entry of a PARAMETERS section."""
+    details = "".join(
+        f"    {label}: {info[key]}\n" for key, label in _PARAM_FIELDS if key in info
+    )
+    return f"  - {name}: {info.get('description', 'No description')}\n{details}"
+
+
+@dataclass(slots=True)
 class ToolDocumentation:
     """Container for comprehensive tool documentation."""
 
@@ -35,73 +64,82 @@ class ToolDocumentation:
     categories: List[str]
     version: str = "1.0.0"
 
+    # Rendered descriptions, filled on first use (tool_documentation renders them eagerly)
+    _full_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _detailed_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _basic_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def get_multiline_description(self) -> str:
         """Get the full multiline description."""
-        lines = []
-        lines.append(f"[TOOL] {self.name.upper()}")
-        lines.append("")
-        lines.append(self.description)
-        lines.append("")
-
-        if self.summary:
-            lines.append(f"SUMMARY: {self.summary}")
-            lines.append("")
-
-        if self.parameters:
-            lines.append("PARAMETERS:")
-            for param_name, param_info in self.parameters.items():
-                lines.append(f"  - {param_name}: {param_info.get('description', 'No description')}")
-                if 'type' in param_info:
-                    lines.append(f"    Type: {param_info['type']}")
-                if 'default' in param_info:
-                    lines.append(f"    Default: {param_info['default']}")
-                if 'required' in param_info:
-                    lines.append(f"    Required: {param_info['required']}")
-                lines.append("")
-
-        if self.examples:
-            lines.append("EXAMPLES:")
-            for i, example in enumerate(self.examples, 1):
-                lines.append(f"  {i}. {example.get('description', 'Example')}")
-                if 'code' in example:
-                    lines.append(f"     {example['code']}")
-                lines.append("")
-
-        if self.returns:
-            lines.append("RETURNS:")
-            lines.append(f"  {self.returns.get('description', 'No return description')}")
-            if 'type' in self.returns:
-                lines.append(f"  Type: {self.returns['type']}")
-            lines.append("")
-
-        if self.notes:
-            lines.append("NOTES:")
-            for note in self.notes:
-                lines.append(f"  - {note}")
-            lines.append("")
-
-        if self.warnings:
-            lines.append("WARNINGS:")
-            for warning in self.warnings:
-                lines.append(f"  - {warning}")
-            lines.append("")
-
-        if self.related_tools:
-            lines.append("RELATED TOOLS:")
-            for tool in self.related_tools:
-                lines.append(f"  - {tool}")
-            lines.append("")
-
-        lines.append(f"Version: {self.version}")
-        return "\n".join(lines)
+        if self._full_str is None:
+            self._full_str = self._render_multiline_description()
+        return self._full_str
+
+    def _render_multiline_description(self) -> str:
+        """Render the full multiline description."""
+        summary = f"SUMMARY: {self.summary}\n\n" if self.summary else ""
+        return (
+            f"[TOOL] {self.name.upper()}\n\n"
+            f"{self.description}\n\n"
+            f"{summary}"
+            f"{self._format_parameters()}"
+            f"{self._format_examples()}"
+            f"{self._format_returns()}"
+            f"{self._format_list('NOTES', self.notes)}"
+            f"{self._format_list('WARNINGS', self.warnings)}"
+            f"{self._format_list('RELATED TOOLS', self.related_tools)}"
+            f"Version: {self.version}"
+        )
+
+    def _format_parameters(self) -> str:
+        """Format the PARAMETERS section, or an empty string if there are none."""
+        if not self.parameters:
+            return ""
+        blocks = "\n".join(_format_param(name, info) for name, info in self.parameters.items())
+        return f"PARAMETERS:\n{blocks}\n"
+
+    def _format_examples(self) -> str:
+        """Format the EXAMPLES section, or an empty string if there are none."""
+        if not self.examples:
+            return ""
+        blocks = []
+        for i, example in enumerate(self.examples, 1):
+            block = f"  {i}. {example.get('description', 'Example')}\n"
+            if 'code' in example:
+                block += f"     {example['code']}\n"
+            blocks.append(block)
+        return "EXAMPLES:\n" + "\n".join(blocks) + "\n"
+
+    def _format_returns(self) -> str:
+        """Format the RETURNS section, or an empty string if undocumented."""
+        if not self.returns:
+            return ""
+        return_type = f"  Type: {self.returns['type']}\n" if 'type' in self.returns else ""
+        return (
+            f"RETURNS:\n"
+            f"  {self.returns.get('description', 'No return description')}\n"
+            f"{return_type}\n"
+        )
+
+    @staticmethod
+    def _format_list(title: str, items: List[str]) -> str:
+        """Format a titled bullet list section, or an empty string if empty."""
+        if not items:
+            return ""
+        bullets = "".join(f"  - {item}\n" for item in items)
+        return f"{title}:\n{bullets}\n"
 
     def get_basic_description(self) -> str:
         """Get a basic single-line description."""
-        return self.summary or self.description.split('.')[0] + '.'
+        if self._basic_str is None:
+            self._basic_str = self.summary or self.description.partition('.')[0] + '.'
+        return self._basic_str
 
     def get_detailed_description(self) -> str:
         """Get a detailed but concise description."""
-        return f"{self.description} (Version: {self.version})"
+        if self._detailed_str is None:
+            self._detailed_str = f"{self.description} (Version: {self.version})"
+        return self._detailed_str
 
 
 def tool_documentation(
@@ -152,6 +190,11 @@ def tool_documentation(
             version=version
         )
 
+        # Documentation is fixed from here on, so render it once up front
+        doc.get_multiline_description()
+        doc.get_detailed_description()
+        doc.get_basic_description()
+
         # Store documentation on the function
         func._tool_documentation = doc
 
@@ -163,10 +206,62 @@ def tool_documentation(
     return decorator
 
 
+class _ToolDocumentationRegistry(Dict[str, ToolDocumentation]):
+    """Tool documentation by name, counting mutations in ``generation``.
+
+    Indexes derived from the registry compare generations to know when to rebuild,
+    which also catches entries replaced in place without changing the size.
+    """
+
+    generation = 0
+
+    def _bump(self) -> None:
+        self.generation += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._bump()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._bump()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._bump()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._bump()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._bump()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._bump()
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._bump()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._bump()
+
+
 def get_all_tool_documentation() -> Dict[str, ToolDocumentation]:
     """Get documentation for all registered tools."""
-    # This will be populated when tools are registered
-    return getattr(get_all_tool_documentation, '_docs', {})
+    return get_all_tool_documentation._docs
+
+
+# Populated in place when tools are registered, so callers always share one dict
+get_all_tool_documentation._docs = _ToolDocumentationRegistry()
 
 
 # Tool registration is now handled via @mcp.tool() decorators
@@ -205,75 +300,78 @@ class TranscodeRequest(BaseModel):
     )
 
 
-class TranscodeResponse(BaseModel):
-    """Response model for the transcode_video tool with FastMCP 2.12 compliant schema."""
-    job_id: str = Field(
-        ...,
+# Job states, validated as a set lookup rather than a regex match
+TranscodeStatus = Literal["queued", "processing", "completed", "failed", "cancelled"]
+JobStatus = Literal["queued", "processing", "completed", "failed", "cancelled", "not_found"]
+
+
+@dataclass(slots=True)
+class TranscodeResponse:
+    """Response model for the transcode_video tool with FastMCP 2.12 compliant schema.
+
+    Built from trusted server data, so it is a plain dataclass: no validation
+    runs per response, while the Field metadata still drives the output schema.
+    """
+    job_id: Annotated[str, Field(
         description="Unique identifier for tracking the transcode job",
         min_length=1,
         max_length=100,
         examples=["job_12345", "batch_001_001", "transcode_2025_01_22_143022"]
-    )
-    status: str = Field(
-        ...,
+    )]
+    status: Annotated[TranscodeStatus, Field(
         description="Current status of the transcode job",
-        pattern="^(queued|processing|completed|failed|cancelled)$",
         examples=["queued", "processing", "completed", "failed"]
-    )
-    input_path: str = Field(
-        ...,
+    )]
+    input_path: Annotated[str, Field(
         description="Path to the input video file",
-        min_length=1,
         max_length=1000,
         examples=["/videos/input.mp4", "C:\\videos\\input.mkv"]
-    )
-    output_path: str = Field(
-        ...,
+    )]
+    output_path: Annotated[str, Field(
         description="Path where the output file will be saved",
-        min_length=1,
         max_length=1000,
         examples=["/videos/output.mkv", "C:\\videos\\output.mp4"]
-    )
+    )]
+    error: Annotated[Optional[str], Field(
+        description="Error message if the job could not be queued",
+        examples=["Input file not found", "Invalid preset: Ultra 8K"]
+    )] = None
 
 
-class JobStatusResponse(BaseModel):
-    """Response model for job status with FastMCP 2.12 compliant schema."""
-    job_id: str = Field(
-        ...,
+@dataclass(slots=True)
+class JobStatusResponse:
+    """Response model for job status with FastMCP 2.12 compliant schema.
+
+    A plain dataclass like TranscodeResponse; the not-found response carries
+    empty paths, which the old per-instance validation rejected.
+    """
+    job_id: Annotated[str, Field(
         description="Unique identifier of the transcode job",
         min_length=1,
         max_length=100,
         examples=["job_12345", "batch_001_001"]
-    )
-    status: str = Field(
-        ...,
+    )]
+    status: Annotated[JobStatus, Field(
         description="Current status of the transcode job",
-        pattern="^(queued|processing|completed|failed|cancelled|not_found)$",
         examples=["queued", "processing", "completed", "failed"]
-    )
-    progress: float = Field(
-        ...,
+    )]
+    progress: Annotated[float, Field(
         description="Progress percentage of the transcode job",
         ge=0.0,
         le=100.0,
         examples=[0.0, 25.5, 50.0, 75.2, 100.0]
-    )
-    error: Optional[str] = Field(
-        None,
+    )]
+    error: Annotated[Optional[str], Field(
         description="Error message if the job failed",
         examples=["HandBrake CLI not found", "Input file not found", "Encoding failed"]
-    )
-    input_path: str = Field(
-        ...,
+    )]
+    input_path: Annotated[str, Field(
         description="Path to the input video file",
-        min_length=1,
         max_length=1000,
         examples=["/videos/input.mp4", "C:\\videos\\input.mkv"]
-    )
-    output_path: str = Field(
-        ...,
+    )]
+    output_path: Annotated[str, Field(
         description="Path where the output file will be saved",
-        min_length=1,
         max_length=1000,
         examples=["/videos/output.mkv", "C:\\videos\\output.mp4"]
-    )
+    )]
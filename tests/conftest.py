@@ -1,11 +1,18 @@
 """Pytest configuration for HandBrake MCP tests."""
+import os
 import pytest
 import subprocess
 from pathlib import Path
 
 
 def is_handbrake_available():
-    """Check if HandBrakeCLI is available on the system."""
+    """Check if HandBrakeCLI is available on the system.
+
+    scripts/run_tests.py exports its own probe result, which is reused here.
+    """
+    exported = os.environ.get("HBMCP_HANDBRAKE_AVAILABLE")
+    if exported is not None:
+        return exported == "1"
     try:
         result = subprocess.run(
             ["HandBrakeCLI", "--version"],
@@ -31,6 +38,12 @@ def handbrake_available():
     return is_handbrake_available()
 
 
+@pytest.fixture(scope="session")
+def handbrake_version():
+    """HandBrakeCLI version line exported by scripts/run_tests.py, if any."""
+    return os.environ.get("HBMCP_HANDBRAKE_VERSION") or None
+
+
 @pytest.fixture
 def skip_if_no_handbrake(handbrake_available):
     """Skip test if HandBrake is not available."""
@@ -6,10 +6,19 @@ import subprocess
 import tempfile
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from handbrake_mcp.api.v1 import endpoints
 from handbrake_mcp.services.handbrake import HandBrakeService, TranscodeJob
-from handbrake_mcp.core.config import Settings
+from handbrake_mcp.services import watch_service as watch_module
+from handbrake_mcp.services.watch_service import WatchHandler, WatchService
+from handbrake_mcp.tools import handbrake_tools, help_tools
+from handbrake_mcp.tools.utility_tools import ToolDocumentation, get_all_tool_documentation
+from handbrake_mcp.core.config import Settings, compile_file_patterns
 
 
 def create_test_video(output_path: Path, duration_seconds: int = 2) -> bool:
@@ -112,6 +121,61 @@ class TestHandBrakeServiceUnit:
         assert job.status == "completed"
         assert job.progress == 100.0
     
+    async def test_transcode_many(self, unit_test_setup):
+        """Test batch submission returns a job ID or an error per spec, in order."""
+        setup = unit_test_setup
+        service = setup['service']
+        with patch.object(service, '_check_system_resources', new=AsyncMock()), \
+                patch.object(service, '_run_transcode_job', new=AsyncMock()):
+            results = await service.transcode_many([
+                {"input_path": str(setup['input_file']), "output_path": str(setup['output_file'])},
+                {"input_path": str(setup['test_dir'] / "missing.mp4"), "output_path": str(setup['output_file'])},
+            ])
+
+        assert len(results) == 2
+        assert results[0] in service.jobs
+        assert service.jobs[results[0]].status == "queued"
+        assert isinstance(results[1], FileNotFoundError)
+
+    async def test_concurrent_submissions_respect_queue_limit(self, unit_test_setup):
+        """Test concurrent transcode calls cannot overshoot the pending job limit."""
+        setup = unit_test_setup
+        service = setup['service']
+
+        async def yield_to_loop():
+            await asyncio.sleep(0)
+
+        with patch.object(service, '_check_system_resources', new=AsyncMock(side_effect=yield_to_loop)), \
+                patch.object(service, '_run_transcode_job', new=AsyncMock()):
+            results = await asyncio.gather(
+                *(service.transcode(str(setup['input_file']), str(setup['output_file'])) for _ in range(30)),
+                return_exceptions=True,
+            )
+
+        accepted = [r for r in results if not isinstance(r, Exception)]
+        assert len(accepted) == service._max_pending_jobs
+        assert service._pending_jobs == service._max_pending_jobs
+        assert all("Job queue full" in str(r) for r in results if isinstance(r, Exception))
+
+    async def test_cancel_queued_job(self, unit_test_setup):
+        """Test a job still waiting for a slot can be cancelled and never starts."""
+        setup = unit_test_setup
+        service = setup['service']
+        job = TranscodeJob.model_construct(
+            job_id="test_cancel_queued_job",
+            input_path=setup['input_file'],
+            output_path=setup['output_file'],
+            status="queued",
+        )
+        service.jobs[job.job_id] = job
+
+        assert await service.cancel_job(job.job_id) is True
+        assert job.status == "cancelled"
+        with patch.object(service, '_execute_transcode_job', new=AsyncMock()) as execute:
+            await service._run_transcode_job(job)
+        execute.assert_not_called()
+        assert (await service.wait_for_job(job.job_id, timeout=0.01)).status == "cancelled"
+
     async def test_get_job_status(self, unit_test_setup):
         """Test getting job status."""
         setup = unit_test_setup
@@ -143,7 +207,90 @@ class TestHandBrakeServiceUnit:
         result = await setup['service'].cancel_job(job_id)
         assert result is True
         assert job.status == "cancelled"
-    
+
+        # The runner seeing the terminated process exit must not overwrite the cancellation
+        setup['service']._set_job_status(job, "failed")
+        assert job.status == "cancelled"
+        assert await setup['service'].cancel_job(job_id) is False
+
+    async def test_active_jobs_count(self, unit_test_setup):
+        """Test that the active job count follows status transitions."""
+        setup = unit_test_setup
+        service = setup['service']
+        job = TranscodeJob.model_construct(
+            job_id="test_count_job",
+            input_path=setup['input_file'],
+            output_path=setup['output_file'],
+            status="queued",
+        )
+
+        service._set_job_status(job, "processing")
+        assert service.active_jobs == 1
+        service._set_job_status(job, "processing")
+        assert service.active_jobs == 1
+        service._set_job_status(job, "completed")
+        assert service.active_jobs == 0
+
+    async def test_wait_for_job(self, unit_test_setup):
+        """Test waiting for a job returns once it reaches a terminal status."""
+        setup = unit_test_setup
+        service = setup['service']
+        job = TranscodeJob.model_construct(
+            job_id="test_wait_job",
+            input_path=setup['input_file'],
+            output_path=setup['output_file'],
+            status="queued",
+        )
+        service.jobs[job.job_id] = job
+
+        assert (await service.wait_for_job(job.job_id, timeout=0.01)).status == "queued"
+        waiter = asyncio.create_task(service.wait_for_job(job.job_id))
+        await asyncio.sleep(0)
+        service._set_job_status(job, "completed")
+        assert (await asyncio.wait_for(waiter, timeout=1)).status == "completed"
+        assert await service.wait_for_job("unknown_job") is None
+
+    async def test_get_job_statuses(self, unit_test_setup):
+        """Test bulk status lookup mixes cached, live and unknown jobs in input order."""
+        setup = unit_test_setup
+        service = setup['service']
+        done = TranscodeJob.model_construct(
+            job_id="test_statuses_done",
+            input_path=setup['input_file'],
+            output_path=setup['output_file'],
+            status="completed",
+            progress=100.0,
+        )
+        live = TranscodeJob.model_construct(
+            job_id="test_statuses_live",
+            input_path=setup['input_file'],
+            output_path=setup['output_file'],
+            status="processing",
+            progress=40.0,
+        )
+        service.jobs[done.job_id] = done
+        service.jobs[live.job_id] = live
+
+        try:
+            with patch.object(handbrake_tools, 'get_handbrake_service', return_value=service):
+                first = await handbrake_tools.get_job_statuses([done.job_id, "unknown_job", live.job_id])
+                assert [r.job_id for r in first] == [done.job_id, "unknown_job", live.job_id]
+                assert [r.status for r in first] == ["completed", "not_found", "processing"]
+                assert first[1].error == "Job not found"
+                assert first[2].progress == 40.0
+
+                # The finished job is now answered from the cache, the others are looked up again
+                live.progress = 60.0
+                second = await handbrake_tools.get_job_statuses(
+                    [live.job_id, done.job_id, "unknown_job", done.job_id]
+                )
+                assert [r.job_id for r in second] == [live.job_id, done.job_id, "unknown_job", done.job_id]
+                assert second[0].progress == 60.0
+                assert second[1] is first[0] and second[3] is first[0]
+                assert second[2].status == "not_found"
+        finally:
+            handbrake_tools._terminal_status_cache.pop(done.job_id, None)
+
     async def test_get_presets(self, unit_test_setup):
         """Test getting HandBrake presets."""
         setup = unit_test_setup
@@ -155,6 +302,269 @@ class TestHandBrakeServiceUnit:
             assert "HQ 1080p30" in presets
             assert "Very Fast 1080p30" in presets
 
+    async def test_concurrent_get_presets_query_once(self, unit_test_setup):
+        """Test concurrent preset lookups share a single HandBrakeCLI query."""
+        service = unit_test_setup['service']
+
+        async def slow_preset_list(args):
+            await asyncio.sleep(0.05)
+            return "Available presets:\n  Fast 1080p30\n  HQ 1080p30\n"
+
+        with patch.object(service, 'get_handbrake_version', new=AsyncMock(return_value="1.7.0")), \
+                patch.object(service, '_run_handbrake', new=AsyncMock(side_effect=slow_preset_list)) as mock_run:
+            first, second = await asyncio.gather(service.get_presets(), service.get_presets())
+
+        assert mock_run.await_count == 1
+        assert first == second
+        assert "Fast 1080p30" in first
+
+    async def test_presets_refetched_after_ttl_or_invalidation(self, unit_test_setup):
+        """Test the preset cache is reused within its TTL and refetched after expiry or invalidation."""
+        service = unit_test_setup['service']
+        with patch.object(service, 'get_handbrake_version', new=AsyncMock(return_value="1.7.0")), \
+                patch.object(service, '_run_handbrake', new=AsyncMock(return_value="  Fast 1080p30\n")) as mock_run:
+            await service.get_presets()
+            await service.get_presets()
+            assert mock_run.await_count == 1
+
+            # Age the cache past its TTL
+            service._presets_loaded_at -= service._presets_ttl_seconds + 1
+            await service.get_presets()
+            assert mock_run.await_count == 2
+
+            service.invalidate_presets()
+            await service.get_presets()
+            assert mock_run.await_count == 3
+            await service.get_presets()
+            assert mock_run.await_count == 3
+
+
+@pytest.mark.unit
+class TestSettingsUnit:
+    """Unit tests for settings parsing and derived values."""
+
+    def test_compile_file_patterns(self):
+        """Test combined glob patterns match like fnmatch, and an empty list matches nothing."""
+        pattern = compile_file_patterns(["*.mp4", "*.mkv"])
+        assert pattern.match(os.path.normcase("movie.mp4"))
+        assert pattern.match(os.path.normcase("show.mkv"))
+        assert not pattern.match("notes.txt")
+
+        empty = compile_file_patterns([])
+        assert not empty.match("movie.mp4")
+        assert not empty.match("notes.txt")
+        assert not empty.match("")
+
+    def test_empty_file_patterns_setting_matches_nothing(self, monkeypatch):
+        """Test FILE_PATTERNS='[]' does not turn the watch folder into a match-all."""
+        monkeypatch.setenv("FILE_PATTERNS", "[]")
+        assert not Settings().compiled_file_pattern.match("x.txt")
+
+    def test_webhook_events_comma_string(self):
+        """Test a comma-separated event string is split and stripped."""
+        settings = Settings(webhook_events=" job_started, job_failed ,")
+        assert settings.webhook_events == ["job_started", "job_failed"]
+
+    def test_webhook_events_unknown_event_rejected(self):
+        """Test an unknown event name fails validation and names the bad event."""
+        with pytest.raises(ValueError, match="Invalid webhook events: job_exploded"):
+            Settings(webhook_events="job_started,job_exploded")
+
+    def test_webhook_events_empty_string(self):
+        """Test an empty event string means no events rather than an error."""
+        assert Settings(webhook_events="").webhook_events == []
+
+
+@pytest.mark.unit
+class TestApiUnit:
+    """Unit tests for the REST API endpoints."""
+
+    def test_batch_transcode_matches_mcp_tool(self, tmp_path):
+        """Test /transcode/batch returns per-job entries in order, numbered like the MCP tool's."""
+        input_file = tmp_path / "input.mp4"
+        input_file.write_bytes(b"test video data" * 100)
+        missing_file = tmp_path / "missing.mp4"
+        output_file = tmp_path / "output.mkv"
+
+        service = HandBrakeService()
+        app = FastAPI()
+        app.include_router(endpoints.router, prefix="/api/v1")
+        jobs = [
+            {"input_path": str(input_file), "output_path": str(output_file)},
+            {"input_path": str(missing_file), "output_path": str(output_file)},
+        ]
+
+        with patch.object(endpoints, 'get_handbrake_service', return_value=service), \
+                patch.object(handbrake_tools, 'get_handbrake_service', return_value=service), \
+                patch.object(service, '_check_system_resources', new=AsyncMock()), \
+                patch.object(service, 'get_presets', new=AsyncMock(return_value=["Fast 1080p30"])), \
+                patch.object(service, '_run_transcode_job', new=AsyncMock()):
+            with TestClient(app) as client:
+                response = client.post("/api/v1/transcode/batch", json={"jobs": jobs})
+            mcp_results = asyncio.run(handbrake_tools.batch_transcode(jobs[1:]))
+
+        assert response.status_code == 200
+        queued, failed = response.json()
+        assert queued["status"] == "queued"
+        assert queued["job_id"] in service.jobs
+        assert queued["input_path"] == str(input_file)
+        assert failed["status"] == "failed"
+        assert failed["input_path"] == str(missing_file)
+        assert "Input file not found" in failed["error"]
+        assert failed["job_id"].startswith("error_")
+
+        # Both surfaces draw failed-entry IDs from one sequence
+        mcp_failed = mcp_results[0]
+        assert mcp_failed.status == "failed"
+        assert mcp_failed.error == failed["error"]
+        assert int(mcp_failed.job_id.removeprefix("error_")) == int(failed["job_id"].removeprefix("error_")) + 1
+
+
+def make_tool_doc(name: str, categories, summary: str = "Test tool") -> ToolDocumentation:
+    """Build a minimal ToolDocumentation for help index tests."""
+    return ToolDocumentation(
+        name=name,
+        description=summary,
+        summary=summary,
+        parameters={},
+        examples=[],
+        returns={},
+        notes=[],
+        warnings=[],
+        related_tools=[],
+        categories=list(categories),
+    )
+
+
+@pytest.mark.unit
+class TestHelpToolsUnit:
+    """Unit tests for the help tool indexes."""
+
+    def test_indexes_follow_in_place_registry_updates(self):
+        """Test replacing a registry entry without changing its size rebuilds the indexes."""
+        docs = get_all_tool_documentation()
+        try:
+            docs["test_help_tool"] = make_tool_doc("test_help_tool", ["alpha"], "Original summary")
+            assert help_tools.get_tools_by_category("alpha") == ["test_help_tool"]
+            assert help_tools.search_tools("original summary") == ["test_help_tool"]
+
+            docs["test_help_tool"] = make_tool_doc("test_help_tool", ["beta"], "Replaced summary")
+            assert help_tools.get_tools_by_category("alpha") == []
+            assert help_tools.get_tools_by_category("beta") == ["test_help_tool"]
+            assert help_tools.search_tools("original summary") == []
+            assert help_tools.search_tools("replaced summary") == ["test_help_tool"]
+        finally:
+            docs.pop("test_help_tool", None)
+        assert help_tools.get_tools_by_category("beta") == []
+
+    def test_get_tool_categories_returns_a_copy(self):
+        """Test mutating the returned categories leaves the shared index untouched."""
+        docs = get_all_tool_documentation()
+        try:
+            docs["test_help_tool"] = make_tool_doc("test_help_tool", ["alpha"])
+            categories = help_tools.get_tool_categories()
+            assert categories["alpha"] == ["test_help_tool"]
+            assert categories is not help_tools.get_tool_categories()
+
+            categories["alpha"].append("intruder")
+            categories["injected"] = ["intruder"]
+            assert help_tools.get_tool_categories()["alpha"] == ["test_help_tool"]
+            assert "injected" not in help_tools.get_tool_categories()
+        finally:
+            docs.pop("test_help_tool", None)
+
+
+def file_event(path: Path) -> SimpleNamespace:
+    """Minimal stand-in for a watchdog file event."""
+    return SimpleNamespace(is_directory=False, src_path=str(path))
+
+
+@pytest.mark.unit
+class TestWatchServiceUnit:
+    """Unit tests for the watch folder handler and service."""
+
+    async def test_modify_burst_after_create_queues_once(self, tmp_path):
+        """Test a create followed by a burst of modifies queues the file once, after the quiet period."""
+        queue = asyncio.Queue()
+        handler = WatchHandler(AsyncMock(), ["*.mp4"], queue=queue, loop=asyncio.get_running_loop())
+        handler._debounce_seconds = 0.05
+        new_file = tmp_path / "a.mp4"
+
+        handler.on_created(file_event(new_file))
+        for _ in range(5):
+            handler.on_modified(file_event(new_file))
+            await asyncio.sleep(0.01)
+        assert queue.empty()
+
+        await asyncio.sleep(0.2)
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == (handler, new_file)
+        assert not handler._pending
+
+    async def test_modify_without_create_is_ignored(self, tmp_path):
+        """Test modifications to files that weren't just created never queue them."""
+        queue = asyncio.Queue()
+        handler = WatchHandler(AsyncMock(), ["*.mp4"], queue=queue, loop=asyncio.get_running_loop())
+        handler._debounce_seconds = 0.01
+
+        handler.on_modified(file_event(tmp_path / "existing.mp4"))
+        await asyncio.sleep(0.1)
+        assert queue.empty()
+        assert not handler._pending
+
+    async def test_full_queue_drops_file_with_warning(self, tmp_path, caplog):
+        """Test a file arriving while the queue is full is dropped and logged."""
+        queue = asyncio.Queue(maxsize=1)
+        handler = WatchHandler(AsyncMock(), ["*.mp4"], queue=queue, loop=asyncio.get_running_loop())
+        queue.put_nowait((handler, tmp_path / "first.mp4"))
+
+        with caplog.at_level("WARNING", logger=watch_module.__name__):
+            handler._enqueue(tmp_path / "second.mp4")
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait()[1] == tmp_path / "first.mp4"
+        assert "Watch queue full, dropping new file" in caplog.text
+
+    async def test_watch_folder_end_to_end(self, tmp_path):
+        """Test a real observer calls back once per new matching file and stop() cancels the workers."""
+        seen = []
+        service = WatchService()
+        await service.start(seen.append, [tmp_path], ["*.mp4"])
+        workers = list(service._workers)
+        assert len(workers) == service._worker_count
+        try:
+            video = tmp_path / "a.mp4"
+            with open(video, "wb") as f:
+                for _ in range(5):
+                    f.write(b"x" * 1024)
+                    f.flush()
+            (tmp_path / "b.txt").write_text("not a video")
+
+            for _ in range(100):
+                if seen:
+                    break
+                await asyncio.sleep(0.05)
+            await asyncio.sleep(0.7)  # Room for a duplicate callback to show up
+            assert seen == [video]
+        finally:
+            await service.stop()
+
+        assert all(worker.cancelled() for worker in workers)
+        assert service._workers == []
+        assert not service.is_running()
+
+    def test_polling_observer_setting(self, monkeypatch):
+        """Test watch_use_polling selects a PollingObserver with the configured interval."""
+        monkeypatch.setattr(watch_module.settings, "watch_use_polling", True)
+        monkeypatch.setattr(watch_module.settings, "watch_poll_interval", 2.5)
+
+        observer = WatchService().observer
+        assert isinstance(observer, watch_module.PollingObserver)
+        assert observer.timeout == 2.5
+
+        monkeypatch.setattr(watch_module.settings, "watch_use_polling", False)
+        assert not isinstance(WatchService().observer, watch_module.PollingObserver)
+
 
 @pytest.mark.integration
 @pytest.mark.slow